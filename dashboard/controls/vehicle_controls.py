@@ -3,12 +3,17 @@ Vehicle Controls Interface for Assetto Corsa
 Handles sending control commands to the game
 """
 
+import logging
 import struct
 import socket
 import time
-from typing import Any, Dict, Optional
+from collections import deque
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterable, Optional, Tuple
 from enum import IntEnum
 
+logger = logging.getLogger("ACDashboard.controls")
+
 class ACControlCommand(IntEnum):
     """AC control command types"""
     TC_LEVEL = 1
@@ -25,15 +30,105 @@ class ACControlCommand(IntEnum):
     ENGINE_MAP = 12
     IGNITION = 13
 
+# Control socket tuning
+CONTROL_SEND_BUFFER_SIZE = 1 << 20  # 1 MiB
+IPTOS_LOWDELAY = 0x10
+
+# Number of sent commands kept in the debug ring buffer
+COMMAND_LOG_SIZE = 1024
+
+# Packet format: [command_type:4][value_type:4][value:4]
+# Batched datagrams are a plain concatenation of these 12-byte records
+_BOOL_PACKET = struct.Struct('<III')
+_INT_PACKET = struct.Struct('<IIi')
+_FLOAT_PACKET = struct.Struct('<IIf')
+PACKET_SIZE = _INT_PACKET.size
+
+# Batches up to this many commands are assembled in a reused buffer
+MAX_BATCH_COMMANDS = 8
+
+@lru_cache(maxsize=256)
+def _pack_bool(command_type: int, value: bool) -> bytes:
+    """Pack a boolean command packet"""
+    return _BOOL_PACKET.pack(command_type, 1, 1 if value else 0)
+
+@lru_cache(maxsize=256)
+def _pack_int(command_type: int, value: int) -> bytes:
+    """Pack an integer command packet"""
+    return _INT_PACKET.pack(command_type, 2, value)
+
+@lru_cache(maxsize=256)
+def _pack_rounded_float(command_type: int, value: float) -> bytes:
+    """Pack a float command packet (value pre-rounded by the caller)"""
+    return _FLOAT_PACKET.pack(command_type, 3, value)
+
+def _pack_float(command_type: int, value: float) -> bytes:
+    """Pack a float command packet"""
+    # Round to bound the cache size for continuous values
+    return _pack_rounded_float(command_type, round(value, 3))
+
+# Value type to packer; bool precedes int since bool is a subclass of int
+_PACKERS = {
+    bool: _pack_bool,
+    int: _pack_int,
+    float: _pack_float,
+}
+
+class ControlState:
+    """Current vehicle control values, shared by the panel and keyboard controls"""
+    
+    __slots__ = ('tc_level', 'abs_level', 'brake_bias', 'turbo_pressure',
+                 'headlights', 'left_indicator', 'right_indicator',
+                 'hazard_lights', 'wipers', 'pit_limiter', 'ignition', 'engine_map')
+    
+    def __init__(self):
+        self.tc_level = 0
+        self.abs_level = 0
+        self.brake_bias = 50.0  # Percent front
+        self.turbo_pressure = 0.0  # Bar
+        self.headlights = False
+        self.left_indicator = False
+        self.right_indicator = False
+        self.hazard_lights = False
+        self.wipers = False
+        self.pit_limiter = False
+        self.ignition = False
+        self.engine_map = 0
+
 class VehicleControls:
     """Handles vehicle control commands"""
     
+    # Command string to AC control command type
+    _COMMAND_MAP = {
+        'tc_level': ACControlCommand.TC_LEVEL,
+        'abs_level': ACControlCommand.ABS_LEVEL,
+        'brake_bias': ACControlCommand.BRAKE_BIAS,
+        'turbo_pressure': ACControlCommand.TURBO_PRESSURE,
+        'headlights': ACControlCommand.HEADLIGHTS,
+        'left_indicator': ACControlCommand.LEFT_INDICATOR,
+        'right_indicator': ACControlCommand.RIGHT_INDICATOR,
+        'hazard_lights': ACControlCommand.HAZARD_LIGHTS,
+        'wipers': ACControlCommand.WIPERS,
+        'pit_limiter': ACControlCommand.PIT_LIMITER,
+        'open_pit_menu': ACControlCommand.OPEN_PIT_MENU,
+        'engine_map': ACControlCommand.ENGINE_MAP,
+        'ignition': ACControlCommand.IGNITION
+    }
+    
     def __init__(self):
         self.control_socket = None
         self.control_host = "localhost"
         self.control_port = 9997  # Different port from telemetry
         self.connected = False
-        self.last_commands = {}
+        self._addr = None
+        
+        # Debug ring buffer of (timestamp_ns, command, value) for sent commands
+        self.debug = False
+        self.command_log = deque(maxlen=COMMAND_LOG_SIZE)
+        
+        # Reused batch buffer; sends only happen on the GUI thread
+        self._batch_buffer = bytearray(PACKET_SIZE * MAX_BATCH_COMMANDS)
+        self._batch_view = memoryview(self._batch_buffer)
         
         # Setup control socket
         self.setup_control_socket()
@@ -42,13 +137,47 @@ class VehicleControls:
         """Setup UDP socket for sending control commands"""
         try:
             self.control_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.control_socket.settimeout(1.0)
-            print(f"Control socket created for {self.control_host}:{self.control_port}")
+            self.control_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, CONTROL_SEND_BUFFER_SIZE)
+            
+            # Request low-delay routing where the platform supports it
+            if hasattr(socket, 'IP_TOS'):
+                try:
+                    self.control_socket.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, IPTOS_LOWDELAY)
+                except OSError:
+                    pass
+            
+            # Never block the GUI thread; a full buffer drops the command instead
+            self.control_socket.setblocking(False)
+            
+            # Resolve the destination once instead of on every send
+            self._addr = socket.getaddrinfo(self.control_host, self.control_port,
+                                            socket.AF_INET, socket.SOCK_DGRAM)[0][4]
+            
+            # Fix the destination so sends skip the per-packet route lookup
+            self.control_socket.connect(self._addr)
             
         except Exception as e:
-            print(f"Failed to setup control socket: {e}")
+            logger.warning("Failed to setup control socket: %s", e)
+            if self.control_socket is not None:
+                self.control_socket.close()
             self.control_socket = None
     
+    def _send_datagram(self, data) -> None:
+        """Send one datagram on the connected control socket
+        
+        A connected UDP socket reports an ICMP port-unreachable for an earlier
+        datagram as ConnectionRefusedError on the next send, which is then not
+        sent. Retry once; if the receiver is still absent, the datagram is
+        dropped silently, as it would have been with sendto().
+        """
+        try:
+            self.control_socket.send(data)
+        except ConnectionRefusedError:
+            try:
+                self.control_socket.send(data)
+            except ConnectionRefusedError:
+                pass
+    
     def send_command(self, command: str, value: Any) -> bool:
         """
         Send control command to AC
@@ -60,86 +189,98 @@ class VehicleControls:
         Returns:
             True if command sent successfully
         """
+        if self.control_socket is None:
+            return False
+        
+        # Map command to AC control type
+        command_type = self._get_command_type(command)
+        if command_type is None:
+            logger.warning("Unknown command: %s", command)
+            return False
+        
+        # Build command packet
+        packet = self._build_command_packet(command_type, value)
+        if packet is None:
+            return False
+        
+        # Send command; a full buffer or unreachable receiver drops it
         try:
-            if not self.control_socket:
-                return False
+            self._send_datagram(packet)
+        except OSError as e:
+            logger.warning("Failed to send command %s: %s", command, e)
+            return False
+        
+        if self.debug:
+            self.command_log.append((time.monotonic_ns(), command, value))
+        
+        return True
+    
+    def send_commands(self, commands: Iterable[Tuple[str, Any]]) -> bool:
+        """
+        Send several control commands to AC in a single datagram
+        
+        Args:
+            commands: (command, value) pairs, applied in order by the receiver
             
-            # Map command to AC control type
+        Returns:
+            True if all commands were sent successfully
+        """
+        if self.control_socket is None:
+            return False
+        
+        commands = tuple(commands)
+        if len(commands) > MAX_BATCH_COMMANDS:
+            buffer = bytearray(PACKET_SIZE * len(commands))
+            view = memoryview(buffer)
+        else:
+            buffer = self._batch_buffer
+            view = self._batch_view
+        
+        # Copy each (cached) packet into the batch buffer
+        offset = 0
+        for command, value in commands:
             command_type = self._get_command_type(command)
             if command_type is None:
-                print(f"Unknown command: {command}")
+                logger.warning("Unknown command: %s", command)
                 return False
             
-            # Build command packet
             packet = self._build_command_packet(command_type, value)
-            if not packet:
+            if packet is None:
                 return False
-            
-            # Send command
-            self.control_socket.sendto(packet, (self.control_host, self.control_port))
-            
-            # Store last command for reference
-            self.last_commands[command] = {
-                'value': value,
-                'timestamp': time.time()
-            }
-            
-            print(f"Sent command: {command} = {value}")
-            return True
-            
-        except Exception as e:
-            print(f"Failed to send command {command}: {e}")
+            buffer[offset:offset + PACKET_SIZE] = packet
+            offset += PACKET_SIZE
+        
+        # Send all commands with one syscall
+        try:
+            self._send_datagram(view[:offset])
+        except OSError as e:
+            logger.warning("Failed to send commands: %s", e)
             return False
+        
+        if self.debug:
+            timestamp = time.monotonic_ns()
+            self.command_log.extend((timestamp, command, value) for command, value in commands)
+        
+        return True
     
     def _get_command_type(self, command: str) -> Optional[ACControlCommand]:
         """Map command string to AC control command type"""
-        command_map = {
-            'tc_level': ACControlCommand.TC_LEVEL,
-            'abs_level': ACControlCommand.ABS_LEVEL,
-            'brake_bias': ACControlCommand.BRAKE_BIAS,
-            'turbo_pressure': ACControlCommand.TURBO_PRESSURE,
-            'headlights': ACControlCommand.HEADLIGHTS,
-            'left_indicator': ACControlCommand.LEFT_INDICATOR,
-            'right_indicator': ACControlCommand.RIGHT_INDICATOR,
-            'hazard_lights': ACControlCommand.HAZARD_LIGHTS,
-            'wipers': ACControlCommand.WIPERS,
-            'pit_limiter': ACControlCommand.PIT_LIMITER,
-            'open_pit_menu': ACControlCommand.OPEN_PIT_MENU,
-            'engine_map': ACControlCommand.ENGINE_MAP,
-            'ignition': ACControlCommand.IGNITION
-        }
-        
-        return command_map.get(command)
+        return self._COMMAND_MAP.get(command)
     
     def _build_command_packet(self, command_type: ACControlCommand, value: Any) -> Optional[bytes]:
         """Build UDP command packet"""
-        try:
-            # Packet format: [command_type:4][value_type:4][value:variable]
-            packet = struct.pack('<I', command_type.value)
-            
-            if isinstance(value, bool):
-                # Boolean value
-                packet += struct.pack('<I', 1)  # Type: bool
-                packet += struct.pack('<I', 1 if value else 0)
-                
-            elif isinstance(value, int):
-                # Integer value
-                packet += struct.pack('<I', 2)  # Type: int
-                packet += struct.pack('<i', value)
-                
-            elif isinstance(value, float):
-                # Float value
-                packet += struct.pack('<I', 3)  # Type: float
-                packet += struct.pack('<f', value)
-                
-            else:
-                print(f"Unsupported value type: {type(value)}")
+        packer = _PACKERS.get(type(value))
+        if packer is None:
+            # Slow path for subclasses (e.g. IntEnum values)
+            packer = next((p for t, p in _PACKERS.items() if isinstance(value, t)), None)
+            if packer is None:
+                logger.warning("Unsupported value type: %s", type(value))
                 return None
-            
-            return packet
-            
-        except Exception as e:
-            print(f"Failed to build command packet: {e}")
+        
+        try:
+            return packer(int(command_type), value)
+        except (struct.error, OverflowError) as e:
+            logger.warning("Failed to build command packet: %s", e)
             return None
     
     def send_tc_level(self, level: int) -> bool:
@@ -164,14 +305,15 @@ class VehicleControls:
     
     def set_indicator(self, left: bool, right: bool) -> bool:
         """Set turn indicators"""
-        success = True
-        success &= self.send_command('left_indicator', left)
-        success &= self.send_command('right_indicator', right)
-        return success
+        return self.send_commands((('left_indicator', left), ('right_indicator', right)))
     
     def toggle_hazards(self, on: bool) -> bool:
-        """Toggle hazard lights"""
-        return self.send_command('hazard_lights', on)
+        """Toggle hazard lights (turning them on clears both indicators)"""
+        if on:
+            return self.send_commands((('left_indicator', False),
+                                       ('right_indicator', False),
+                                       ('hazard_lights', True)))
+        return self.send_command('hazard_lights', False)
     
     def toggle_wipers(self, on: bool) -> bool:
         """Toggle wipers"""
@@ -193,60 +335,100 @@ class VehicleControls:
         """Toggle ignition on/off"""
         return self.send_command('ignition', on)
     
-    def get_last_command(self, command: str) -> Optional[Dict]:
-        """Get last sent command value and timestamp"""
-        return self.last_commands.get(command)
-    
     def cleanup(self):
         """Cleanup resources"""
         if self.control_socket:
             self.control_socket.close()
             self.control_socket = None
 
+# Default key bindings (can be customized via config)
+_DEFAULT_KEY_BINDINGS = {
+    'F1': ('tc_level', 'toggle'),
+    'F2': ('abs_level', 'toggle'),
+    'F3': ('brake_bias', 'adjust'),
+    'F4': ('turbo_pressure', 'adjust'),
+    'F5': ('headlights', 'toggle'),
+    'F6': ('left_indicator', 'toggle'),
+    'F7': ('right_indicator', 'toggle'),
+    'F8': ('hazard_lights', 'toggle'),
+    'F9': ('wipers', 'toggle'),
+    'F10': ('pit_limiter', 'toggle'),
+    'F11': ('open_pit_menu', 'trigger'),
+    'F12': ('ignition', 'toggle'),
+
+    # Arrow keys for adjustments
+    'Up': ('brake_bias', 'increase'),
+    'Down': ('brake_bias', 'decrease'),
+    'Left': ('tc_level', 'decrease'),
+    'Right': ('tc_level', 'increase'),
+
+    # Number keys for direct TC/ABS levels
+    '0': ('tc_level', 0),
+    '1': ('tc_level', 1),
+    '2': ('tc_level', 2),
+    '3': ('tc_level', 3),
+    '4': ('tc_level', 4),
+    '5': ('tc_level', 5),
+    '6': ('tc_level', 6),
+    '7': ('tc_level', 7),
+    '8': ('tc_level', 8),
+    '9': ('tc_level', 9),
+}
+
+# Commands toggled on/off vs. switched between level 0 and 1
+_BOOL_COMMANDS = frozenset({
+    'headlights', 'left_indicator', 'right_indicator',
+    'hazard_lights', 'wipers', 'pit_limiter', 'ignition'
+})
+_LEVEL_COMMANDS = frozenset({'tc_level', 'abs_level'})
+_STATE_COMMANDS = frozenset(ControlState.__slots__)
+
 # Keyboard shortcut integration
 class KeyboardControls:
     """Handles keyboard shortcuts for vehicle controls"""
     
-    def __init__(self, vehicle_controls: VehicleControls):
+    def __init__(self, vehicle_controls: VehicleControls,
+                 control_state: Optional[ControlState] = None):
         self.vehicle_controls = vehicle_controls
+        # Shared with the control panel when given, so both see the same values
+        self.control_state = control_state if control_state is not None else ControlState()
         self.key_bindings = {}
+        self._key_handlers = {}
         self.load_key_bindings()
     
+    def _send(self, command: str, value: Any) -> bool:
+        """Send command and record the value in the control state on success"""
+        if not self.vehicle_controls.send_command(command, value):
+            return False
+        
+        if command == 'brake_bias':
+            # Sent as a ratio, stored as a percentage
+            self.control_state.brake_bias = round(value * 100.0, 3)
+        elif command in _STATE_COMMANDS:
+            setattr(self.control_state, command, value)
+        return True
+    
     def load_key_bindings(self):
         """Load key bindings from configuration"""
-        # Default key bindings (can be customized via config)
-        self.key_bindings = {
-            'F1': ('tc_level', 'toggle'),
-            'F2': ('abs_level', 'toggle'),
-            'F3': ('brake_bias', 'adjust'),
-            'F4': ('turbo_pressure', 'adjust'),
-            'F5': ('headlights', 'toggle'),
-            'F6': ('left_indicator', 'toggle'),
-            'F7': ('right_indicator', 'toggle'),
-            'F8': ('hazard_lights', 'toggle'),
-            'F9': ('wipers', 'toggle'),
-            'F10': ('pit_limiter', 'toggle'),
-            'F11': ('open_pit_menu', 'trigger'),
-            'F12': ('ignition', 'toggle'),
-            
-            # Arrow keys for adjustments
-            'Up': ('brake_bias', 'increase'),
-            'Down': ('brake_bias', 'decrease'),
-            'Left': ('tc_level', 'decrease'),
-            'Right': ('tc_level', 'increase'),
-            
-            # Number keys for direct TC/ABS levels
-            '0': ('tc_level', 0),
-            '1': ('tc_level', 1),
-            '2': ('tc_level', 2),
-            '3': ('tc_level', 3),
-            '4': ('tc_level', 4),
-            '5': ('tc_level', 5),
-            '6': ('tc_level', 6),
-            '7': ('tc_level', 7),
-            '8': ('tc_level', 8),
-            '9': ('tc_level', 9),
+        self.key_bindings = dict(_DEFAULT_KEY_BINDINGS)
+        self._compile_key_bindings()
+    
+    def _compile_key_bindings(self):
+        """Resolve each binding to a ready-to-call handler"""
+        action_handlers = {
+            'toggle': self._do_toggle,
+            'trigger': self._do_trigger,
+            'increase': partial(self._adjust_value, delta=1),
+            'decrease': partial(self._adjust_value, delta=-1),
         }
+        
+        self._key_handlers = {}
+        for key, (command, action) in self.key_bindings.items():
+            if isinstance(action, (int, float)):
+                # Direct value
+                self._key_handlers[key] = partial(self._send, command, action)
+            elif action in action_handlers:
+                self._key_handlers[key] = partial(action_handlers[action], command)
     
     def handle_key_press(self, key: str) -> bool:
         """
@@ -258,69 +440,54 @@ class KeyboardControls:
         Returns:
             True if key was handled
         """
-        if key not in self.key_bindings:
+        handler = self._key_handlers.get(key)
+        if handler is None:
             return False
         
-        command, action = self.key_bindings[key]
-        
         try:
-            if action == 'toggle':
-                # Toggle boolean commands
-                if command in ['headlights', 'left_indicator', 'right_indicator', 
-                              'hazard_lights', 'wipers', 'pit_limiter', 'ignition']:
-                    # Get current state and toggle
-                    last_cmd = self.vehicle_controls.get_last_command(command)
-                    current_state = last_cmd['value'] if last_cmd else False
-                    return self.vehicle_controls.send_command(command, not current_state)
-                
-                elif command in ['tc_level', 'abs_level']:
-                    # Toggle between 0 and 1
-                    last_cmd = self.vehicle_controls.get_last_command(command)
-                    current_level = last_cmd['value'] if last_cmd else 0
-                    new_level = 0 if current_level > 0 else 1
-                    return self.vehicle_controls.send_command(command, new_level)
-            
-            elif action == 'trigger':
-                # One-time actions
-                return self.vehicle_controls.send_command(command, True)
-            
-            elif action == 'increase':
-                # Increase value
-                return self._adjust_value(command, 1)
-            
-            elif action == 'decrease':
-                # Decrease value
-                return self._adjust_value(command, -1)
-            
-            elif isinstance(action, (int, float)):
-                # Direct value
-                return self.vehicle_controls.send_command(command, action)
-            
-        except Exception as e:
-            print(f"Error handling key press {key}: {e}")
+            return handler()
+        except Exception:
+            logger.warning("Error handling key press %s", key, exc_info=True)
             return False
+    
+    def _do_toggle(self, command: str) -> bool:
+        """Toggle a boolean command or switch a level between off and 1"""
+        # Toggle boolean commands
+        if command in _BOOL_COMMANDS:
+            # Get current state and toggle
+            return self._send(command, not getattr(self.control_state, command))
+        
+        elif command in _LEVEL_COMMANDS:
+            # Toggle between 0 and 1
+            new_level = 0 if getattr(self.control_state, command) > 0 else 1
+            return self._send(command, new_level)
         
         return False
     
+    def _do_trigger(self, command: str) -> bool:
+        """Send a one-time action"""
+        return self._send(command, True)
+    
     def _adjust_value(self, command: str, delta: int) -> bool:
         """Adjust numeric value by delta"""
-        last_cmd = self.vehicle_controls.get_last_command(command)
-        current_value = last_cmd['value'] if last_cmd else 0
+        state = self.control_state
         
         if command == 'tc_level':
-            new_value = max(0, min(10, current_value + delta))
+            new_value = max(0, min(10, state.tc_level + delta))
         elif command == 'abs_level':
-            new_value = max(0, min(10, current_value + delta))
+            new_value = max(0, min(10, state.abs_level + delta))
         elif command == 'brake_bias':
-            new_value = max(0.4, min(0.7, current_value + (delta * 0.005)))  # 0.5% steps
+            # 0.5% steps, sent as a ratio
+            new_value = max(40.0, min(70.0, state.brake_bias + (delta * 0.5))) / 100.0
         elif command == 'turbo_pressure':
-            new_value = max(0.0, min(3.0, current_value + (delta * 0.1)))  # 0.1 bar steps
+            new_value = round(max(0.0, min(3.0, state.turbo_pressure + (delta * 0.1))), 1)  # 0.1 bar steps
         else:
             return False
         
-        return self.vehicle_controls.send_command(command, new_value)
+        return self._send(command, new_value)
     
     def save_key_bindings(self, bindings: Dict[str, tuple]):
         """Save custom key bindings"""
         self.key_bindings.update(bindings)
+        self._compile_key_bindings()
         # TODO: Save to configuration file
\ No newline at end of file
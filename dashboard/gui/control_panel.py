@@ -2,9 +2,24 @@
 Vehicle Control Panel for AC Dashboard
 """
 
+import logging
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, List, Tuple
+
+from dashboard.controls.vehicle_controls import ControlState
+
+logger = logging.getLogger("ACDashboard.gui")
+
+# Preformatted label texts for the discrete control steps
+_LEVEL_TEXT = tuple(str(level) for level in range(11))
+_BRAKE_BIAS_TEXT = {step / 2: f"{step / 2:.1f}%" for step in range(80, 141)}  # 40-70%, 0.5% steps
+_TURBO_TEXT = {step / 10: f"{step / 10:.1f} bar" for step in range(31)}  # 0-3 bar, 0.1 bar steps
+
+def _brake_bias_text(bias: float) -> str:
+    """Format brake bias percentage, using the preformatted table when on a step"""
+    text = _BRAKE_BIAS_TEXT.get(bias)
+    return text if text is not None else f"{bias:.1f}%"
 
 class ControlPanel(ttk.Frame):
     """Panel containing vehicle control buttons"""
@@ -14,18 +29,21 @@ class ControlPanel(ttk.Frame):
         self.dashboard_app = dashboard_app
         
         # Control states
-        self.control_states = {
-            'tc_level': 0,
-            'abs_level': 0,
-            'brake_bias': 50.0,
-            'turbo_pressure': 0.0,
-            'headlights': False,
-            'left_indicator': False,
-            'right_indicator': False,
-            'hazard_lights': False,
-            'wipers': False,
-            'pit_limiter': False
-        }
+        self.control_states = ControlState()
+        
+        # Last telemetry value seen per field, so unchanged frames skip Tk work
+        self._last_telemetry = {}
+        
+        # Last rendered and pending label texts, flushed together on idle
+        self._label_cache = {}
+        self._pending_labels = {}
+        self._flush_scheduled = False
+        
+        # Configure the active button style once; toggles only swap style names
+        style = ttk.Style()
+        style.configure('Active.TButton',
+                        background='#4a9eff',
+                        foreground='white')
         
         self.setup_controls()
     
@@ -204,139 +222,145 @@ class ControlPanel(ttk.Frame):
     
     def adjust_tc(self, delta: int):
         """Adjust traction control level"""
-        current = self.control_states['tc_level']
+        current = self.control_states.tc_level
         new_level = max(0, min(10, current + delta))
         
         if new_level != current:
-            self.control_states['tc_level'] = new_level
-            self.tc_value_label.config(text=str(new_level))
+            self.control_states.tc_level = new_level
+            self._set_label_text(self.tc_value_label, _LEVEL_TEXT[new_level])
             self.send_control_command('tc_level', new_level)
     
     def toggle_tc(self):
         """Toggle TC on/off"""
-        current = self.control_states['tc_level']
+        current = self.control_states.tc_level
         if current > 0:
-            self.control_states['tc_level'] = 0
-            self.tc_value_label.config(text="OFF")
+            self.control_states.tc_level = 0
+            self._set_label_text(self.tc_value_label, "OFF")
         else:
-            self.control_states['tc_level'] = 1
-            self.tc_value_label.config(text="1")
+            self.control_states.tc_level = 1
+            self._set_label_text(self.tc_value_label, "1")
         
-        self.send_control_command('tc_level', self.control_states['tc_level'])
+        self.send_control_command('tc_level', self.control_states.tc_level)
     
     def adjust_abs(self, delta: int):
         """Adjust ABS level"""
-        current = self.control_states['abs_level']
+        current = self.control_states.abs_level
         new_level = max(0, min(10, current + delta))
         
         if new_level != current:
-            self.control_states['abs_level'] = new_level
-            self.abs_value_label.config(text=str(new_level))
+            self.control_states.abs_level = new_level
+            self._set_label_text(self.abs_value_label, _LEVEL_TEXT[new_level])
             self.send_control_command('abs_level', new_level)
     
     def toggle_abs(self):
         """Toggle ABS on/off"""
-        current = self.control_states['abs_level']
+        current = self.control_states.abs_level
         if current > 0:
-            self.control_states['abs_level'] = 0
-            self.abs_value_label.config(text="OFF")
+            self.control_states.abs_level = 0
+            self._set_label_text(self.abs_value_label, "OFF")
         else:
-            self.control_states['abs_level'] = 1
-            self.abs_value_label.config(text="1")
+            self.control_states.abs_level = 1
+            self._set_label_text(self.abs_value_label, "1")
         
-        self.send_control_command('abs_level', self.control_states['abs_level'])
+        self.send_control_command('abs_level', self.control_states.abs_level)
     
     def adjust_brake_bias(self, delta: float):
         """Adjust brake bias"""
-        current = self.control_states['brake_bias']
+        current = self.control_states.brake_bias
         new_bias = max(40.0, min(70.0, current + delta))  # Typical range 40-70%
         
         if abs(new_bias - current) > 0.01:
-            self.control_states['brake_bias'] = new_bias
-            self.brake_bias_label.config(text=f"{new_bias:.1f}%")
+            self.control_states.brake_bias = new_bias
+            self._set_label_text(self.brake_bias_label, _brake_bias_text(new_bias))
             self.send_control_command('brake_bias', new_bias / 100.0)  # Send as ratio
     
     def adjust_turbo(self, delta: float):
         """Adjust turbo pressure"""
-        current = self.control_states['turbo_pressure']
-        new_pressure = max(0.0, min(3.0, current + delta))  # Max 3 bar
+        current = self.control_states.turbo_pressure
+        # Max 3 bar, snapped to 0.1 bar so repeated steps don't drift
+        new_pressure = round(max(0.0, min(3.0, current + delta)), 1)
         
         if abs(new_pressure - current) > 0.01:
-            self.control_states['turbo_pressure'] = new_pressure
-            self.turbo_label.config(text=f"{new_pressure:.1f} bar")
+            self.control_states.turbo_pressure = new_pressure
+            self._set_label_text(self.turbo_label, _TURBO_TEXT[new_pressure])
             self.send_control_command('turbo_pressure', new_pressure)
     
     def toggle_headlights(self):
         """Toggle headlights"""
-        current = self.control_states['headlights']
+        current = self.control_states.headlights
         new_state = not current
         
-        self.control_states['headlights'] = new_state
+        self.control_states.headlights = new_state
         self.update_button_style(self.headlights_btn, new_state)
         self.send_control_command('headlights', new_state)
     
     def toggle_left_indicator(self):
         """Toggle left turn signal"""
-        current = self.control_states['left_indicator']
+        current = self.control_states.left_indicator
         new_state = not current
         
+        self.control_states.left_indicator = new_state
+        self.update_button_style(self.left_indicator_btn, new_state)
+        
         # Turn off right indicator if turning on left
         if new_state:
-            self.control_states['right_indicator'] = False
+            self.control_states.right_indicator = False
             self.update_button_style(self.right_indicator_btn, False)
-            self.send_control_command('right_indicator', False)
-        
-        self.control_states['left_indicator'] = new_state
-        self.update_button_style(self.left_indicator_btn, new_state)
-        self.send_control_command('left_indicator', new_state)
+            self.send_control_commands([('right_indicator', False), ('left_indicator', True)])
+        else:
+            self.send_control_command('left_indicator', False)
     
     def toggle_right_indicator(self):
         """Toggle right turn signal"""
-        current = self.control_states['right_indicator']
+        current = self.control_states.right_indicator
         new_state = not current
         
+        self.control_states.right_indicator = new_state
+        self.update_button_style(self.right_indicator_btn, new_state)
+        
         # Turn off left indicator if turning on right
         if new_state:
-            self.control_states['left_indicator'] = False
+            self.control_states.left_indicator = False
             self.update_button_style(self.left_indicator_btn, False)
-            self.send_control_command('left_indicator', False)
-        
-        self.control_states['right_indicator'] = new_state
-        self.update_button_style(self.right_indicator_btn, new_state)
-        self.send_control_command('right_indicator', new_state)
+            self.send_control_commands([('left_indicator', False), ('right_indicator', True)])
+        else:
+            self.send_control_command('right_indicator', False)
     
     def toggle_hazards(self):
         """Toggle hazard lights"""
-        current = self.control_states['hazard_lights']
+        current = self.control_states.hazard_lights
         new_state = not current
         
-        self.control_states['hazard_lights'] = new_state
+        self.control_states.hazard_lights = new_state
         self.update_button_style(self.hazard_btn, new_state)
         
         # Turn off individual indicators when hazards are on
         if new_state:
-            self.control_states['left_indicator'] = False
-            self.control_states['right_indicator'] = False
+            self.control_states.left_indicator = False
+            self.control_states.right_indicator = False
             self.update_button_style(self.left_indicator_btn, False)
             self.update_button_style(self.right_indicator_btn, False)
-        
-        self.send_control_command('hazard_lights', new_state)
+            self.send_control_commands([('left_indicator', False),
+                                        ('right_indicator', False),
+                                        ('hazard_lights', True)])
+        else:
+            self.send_control_command('hazard_lights', False)
     
     def toggle_wipers(self):
         """Toggle wipers"""
-        current = self.control_states['wipers']
+        current = self.control_states.wipers
         new_state = not current
         
-        self.control_states['wipers'] = new_state
+        self.control_states.wipers = new_state
         self.update_button_style(self.wipers_btn, new_state)
         self.send_control_command('wipers', new_state)
     
     def toggle_pit_limiter(self):
         """Toggle pit speed limiter"""
-        current = self.control_states['pit_limiter']
+        current = self.control_states.pit_limiter
         new_state = not current
         
-        self.control_states['pit_limiter'] = new_state
+        self.control_states.pit_limiter = new_state
         self.update_button_style(self.pit_limiter_btn, new_state)
         self.send_control_command('pit_limiter', new_state)
     
@@ -348,54 +372,91 @@ class ControlPanel(ttk.Frame):
     
     def update_button_style(self, button: ttk.Button, active: bool):
         """Update button appearance based on state"""
-        if active:
-            # Create active style if it doesn't exist
-            style = ttk.Style()
-            style.configure('Active.TButton', 
-                          background='#4a9eff',
-                          foreground='white')
-            button.configure(style='Active.TButton')
-        else:
-            button.configure(style='TButton')  # Default style
+        button.configure(style='Active.TButton' if active else 'TButton')
+    
+    def _set_label_text(self, label: ttk.Label, text: str):
+        """Queue a label text update, coalescing bursts into one idle flush"""
+        if label not in self._pending_labels and self._label_cache.get(label) == text:
+            return
+        
+        self._pending_labels[label] = text
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_label_updates)
+    
+    def _flush_label_updates(self):
+        """Apply pending label texts that differ from what is displayed"""
+        self._flush_scheduled = False
+        pending, self._pending_labels = self._pending_labels, {}
+        
+        for label, text in pending.items():
+            if self._label_cache.get(label) != text:
+                label.config(text=text)
+                self._label_cache[label] = text
     
     def send_control_command(self, command: str, value: Any):
         """Send control command to the dashboard app"""
         try:
             if self.dashboard_app:
                 self.dashboard_app.send_control_command(command, value)
-        except Exception as e:
-            print(f"Error sending control command {command}: {e}")
+        except Exception:
+            logger.warning("Error sending control command %s", command, exc_info=True)
+    
+    def send_control_commands(self, commands: List[Tuple[str, Any]]):
+        """Send several control commands to the dashboard app as one packet"""
+        try:
+            if self.dashboard_app:
+                self.dashboard_app.send_control_commands(commands)
+        except Exception:
+            logger.warning("Error sending control commands", exc_info=True)
+    
+    @staticmethod
+    def _level_text(level: int) -> str:
+        """Format a TC/ABS level from telemetry, where 0 means off"""
+        if level <= 0:
+            return "OFF"
+        return _LEVEL_TEXT[level] if level < len(_LEVEL_TEXT) else str(level)
     
     def update_from_telemetry(self, data: Dict[str, Any]):
         """Update control states from telemetry data"""
         try:
+            last = self._last_telemetry
+            
             # Update TC level if available in telemetry
             if 'tc_setting' in data:
-                tc_level = data['tc_setting']
-                if tc_level != self.control_states['tc_level']:
-                    self.control_states['tc_level'] = tc_level
-                    self.tc_value_label.config(text=str(tc_level) if tc_level > 0 else "OFF")
+                tc_level = int(data['tc_setting'])
+                if tc_level != last.get('tc_setting'):
+                    last['tc_setting'] = tc_level
+                    if tc_level != self.control_states.tc_level:
+                        self.control_states.tc_level = tc_level
+                        self._set_label_text(self.tc_value_label, self._level_text(tc_level))
             
             # Update ABS level if available
             if 'abs_setting' in data:
-                abs_level = data['abs_setting']
-                if abs_level != self.control_states['abs_level']:
-                    self.control_states['abs_level'] = abs_level
-                    self.abs_value_label.config(text=str(abs_level) if abs_level > 0 else "OFF")
+                abs_level = int(data['abs_setting'])
+                if abs_level != last.get('abs_setting'):
+                    last['abs_setting'] = abs_level
+                    if abs_level != self.control_states.abs_level:
+                        self.control_states.abs_level = abs_level
+                        self._set_label_text(self.abs_value_label, self._level_text(abs_level))
             
             # Update brake bias if available
             if 'brake_bias' in data:
                 brake_bias = data['brake_bias'] * 100  # Convert from ratio to percentage
-                if abs(brake_bias - self.control_states['brake_bias']) > 0.1:
-                    self.control_states['brake_bias'] = brake_bias
-                    self.brake_bias_label.config(text=f"{brake_bias:.1f}%")
+                if brake_bias != last.get('brake_bias'):
+                    last['brake_bias'] = brake_bias
+                    if abs(brake_bias - self.control_states.brake_bias) > 0.1:
+                        self.control_states.brake_bias = brake_bias
+                        self._set_label_text(self.brake_bias_label, _brake_bias_text(brake_bias))
             
             # Update pit limiter status
             if 'pit_limiter_on' in data:
-                pit_limiter = data['pit_limiter_on']
-                if pit_limiter != self.control_states['pit_limiter']:
-                    self.control_states['pit_limiter'] = pit_limiter
-                    self.update_button_style(self.pit_limiter_btn, pit_limiter)
+                pit_limiter = bool(data['pit_limiter_on'])
+                if pit_limiter != last.get('pit_limiter_on'):
+                    last['pit_limiter_on'] = pit_limiter
+                    if pit_limiter != self.control_states.pit_limiter:
+                        self.control_states.pit_limiter = pit_limiter
+                        self.update_button_style(self.pit_limiter_btn, pit_limiter)
                     
-        except Exception as e:
-            print(f"Error updating controls from telemetry: {e}")
\ No newline at end of file
+        except Exception:
+            logger.warning("Error updating controls from telemetry", exc_info=True)
\ No newline at end of file
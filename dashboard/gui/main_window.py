@@ -2,18 +2,28 @@
 Main GUI Window for AC Telemetry Dashboard
 """
 
+from __future__ import annotations
+
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any, Optional
-import math
+from typing import TYPE_CHECKING, Optional
 
 from dashboard.gui.widgets import (
-    SpeedWidget, RPMWidget, TireWidget, LapTimeWidget,
+    SpeedWidget, RPMWidget, TirePanel, LapTimeWidget,
     GForceWidget, FuelWidget, TemperatureWidget, ConnectionWidget
 )
 from dashboard.gui.control_panel import ControlPanel
 from dashboard.gui.settings_dialog import SettingsDialog
 
+if TYPE_CHECKING:
+    from dashboard.telemetry_parser import TelemetrySnapshot
+
+# Minimum interval between widget redraws (~60 FPS)
+FRAME_INTERVAL_MS = 16
+
+# Gear label text indexed by gear + 1 (-1 = reverse, 0 = neutral)
+_GEAR_STRINGS = ('R', 'N') + tuple(str(i) for i in range(1, 9))
+
 class MainWindow:
     """Main dashboard window containing all telemetry widgets"""
     
@@ -29,13 +39,31 @@ class MainWindow:
         self.main_frame = ttk.Frame(root)
         self.main_frame.pack(fill='both', expand=True, padx=5, pady=5)
         
-        # Configure style
-        self.setup_style()
+        # Configure style; ttk styles live in the Tk interpreter, so configure
+        # them once per root rather than once per process. configure() with no
+        # options returns only the style's own settings, never inherited ones.
+        if not ttk.Style(self.root).configure('Dashboard.TFrame'):
+            self.setup_style()
         
         # Create widgets
         self.widgets = {}
         self.control_panel = None
         
+        # Latest queued (data, connected) awaiting the next frame
+        self._pending = None
+        self._flush_scheduled = False
+        
+        # Last values pushed to each widget; unchanged values are not redrawn
+        self._last_connected = None
+        self._last_speed = None
+        self._last_rpm = None
+        self._last_gear = None
+        self._last_times = None
+        self._last_tires = None
+        self._last_gforce = None
+        self._last_fuel = None
+        self._last_temps = None
+        
         # Setup layout
         self.setup_layout()
         
@@ -47,7 +75,7 @@ class MainWindow:
         
     def setup_style(self):
         """Setup custom styles for the interface"""
-        style = ttk.Style()
+        style = ttk.Style(self.root)
         
         # Configure dark theme
         style.theme_use('clam')
@@ -63,6 +91,17 @@ class MainWindow:
         style.configure('Value.TLabel', background=bg_color, foreground=fg_color, font=('Arial', 14, 'bold'))
         style.configure('Unit.TLabel', background=bg_color, foreground='#cccccc', font=('Arial', 10))
         
+        # Coloured value labels; widgets switch style instead of setting foreground
+        for zone, color in (('Green', 'green'), ('Yellow', 'yellow'), ('Red', 'red'), ('LightBlue', 'lightblue')):
+            style.configure(f'{zone}.Value.TLabel', foreground=color)
+        style.configure('Red.Unit.TLabel', foreground='red')
+        
+        # Level bars (fuel, tire wear); widgets switch style to change zone colour
+        for zone in ('Green', 'Yellow', 'Red'):
+            style.configure(f'{zone}.Horizontal.TProgressbar', background=zone.lower(),
+                            troughcolor='#555555', borderwidth=0, thickness=20)
+            style.configure(f'Wear.{zone}.Horizontal.TProgressbar', thickness=10)
+        
     def setup_layout(self):
         """Setup the main layout with all widgets"""
         
@@ -86,7 +125,8 @@ class MainWindow:
         gear_lap_frame = ttk.Frame(top_frame, style='Dashboard.TFrame')
         gear_lap_frame.pack(side='left', padx=(0, 10))
         
-        self.widgets['gear'] = ttk.Label(gear_lap_frame, text='N', 
+        self._gear_var = tk.StringVar(value='N')
+        self.widgets['gear'] = ttk.Label(gear_lap_frame, textvariable=self._gear_var, 
                                         font=('Arial', 24, 'bold'),
                                         style='Value.TLabel')
         self.widgets['gear'].pack()
@@ -97,23 +137,11 @@ class MainWindow:
         self.widgets['lap_time'].pack(side='right', padx=(10, 0))
         
         # Middle row - Tire information
-        tire_frame = ttk.LabelFrame(self.main_frame, text='Tire Data', style='Dashboard.TFrame')
-        tire_frame.pack(fill='x', pady=5)
-        
-        # Create tire widgets for each wheel
-        tire_positions = [
-            ('Front Left', 0, 0), ('Front Right', 0, 1),
-            ('Rear Left', 1, 0), ('Rear Right', 1, 1)
-        ]
-        
-        for name, row, col in tire_positions:
-            tire_widget = TireWidget(tire_frame, name)
-            tire_widget.grid(row=row, column=col, padx=10, pady=5, sticky='nsew')
-            self.widgets[f'tire_{row}_{col}'] = tire_widget
+        self.widgets['tires'] = TirePanel(self.main_frame)
+        self.widgets['tires'].pack(fill='x', pady=5)
         
-        # Configure grid weights
-        tire_frame.grid_columnconfigure(0, weight=1)
-        tire_frame.grid_columnconfigure(1, weight=1)
+        for tire_widget, (name, row, col) in zip(self.widgets['tires'].tires, TirePanel.POSITIONS):
+            self.widgets[f'tire_{row}_{col}'] = tire_widget
         
         # Bottom row - Additional metrics and controls
         bottom_frame = ttk.Frame(self.main_frame, style='Dashboard.TFrame')
@@ -140,6 +168,16 @@ class MainWindow:
         self.control_panel = ControlPanel(right_frame, self.dashboard_app)
         self.control_panel.pack(fill='both', expand=True)
         
+        # Direct references for the per-tick update path
+        self._connection = self.widgets['connection']
+        self._speed = self.widgets['speed']
+        self._rpm = self.widgets['rpm']
+        self._lap_time = self.widgets['lap_time']
+        self._gforce = self.widgets['gforce']
+        self._fuel = self.widgets['fuel']
+        self._temperature = self.widgets['temperature']
+        self._tires = self.widgets['tires']
+        
     def setup_menu(self):
         """Setup the menu bar"""
         menubar = tk.Menu(self.root)
@@ -163,77 +201,77 @@ class MainWindow:
         menubar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="About", command=self.show_about)
         
-    def update_telemetry(self, data: Dict[str, Any], connected: bool):
+    def update_telemetry(self, data: Optional[TelemetrySnapshot], connected: bool):
+        """Queue new telemetry data; updates within one frame collapse into a single redraw"""
+        self._pending = (data, connected)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(FRAME_INTERVAL_MS, self._flush_telemetry)
+    
+    def _flush_telemetry(self):
+        """Apply the most recent queued telemetry to the widgets"""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self.apply_telemetry(*pending)
+    
+    def apply_telemetry(self, data: Optional[TelemetrySnapshot], connected: bool):
         """Update all widgets with new telemetry data"""
-        try:
-            # Update connection status
-            if 'connection' in self.widgets:
-                self.widgets['connection'].update_status(connected)
-            
-            if not connected or not data:
-                return
-            
-            # Update speed
-            if 'speed' in self.widgets:
-                speed_kmh = data.get('speed_kmh', 0)
-                speed_mph = data.get('speed_mph', 0)
-                self.widgets['speed'].update_speed(speed_kmh, speed_mph)
-            
-            # Update RPM
-            if 'rpm' in self.widgets:
-                rpm = data.get('rpm', 0)
-                max_rpm = data.get('max_rpm', 8000)
-                gear_rec = data.get('gear_recommendation', 'OPTIMAL')
-                self.widgets['rpm'].update_rpm(rpm, max_rpm, gear_rec)
-            
-            # Update gear
-            if 'gear' in self.widgets:
-                gear = data.get('gear', 0)
-                gear_text = 'R' if gear == -1 else 'N' if gear == 0 else str(gear)
-                self.widgets['gear'].config(text=gear_text)
-            
-            # Update lap time
-            if 'lap_time' in self.widgets:
-                lap_time = data.get('lap_time', 0)
-                last_lap = data.get('last_lap', 0)
-                best_lap = data.get('best_lap', 0)
-                self.widgets['lap_time'].update_times(lap_time, last_lap, best_lap)
-            
-            # Update tire data
-            tire_pressure = data.get('tire_pressure', [0]*4)
-            tire_temp = data.get('tire_temperature_core', [0]*4)
-            tire_wear = data.get('tire_wear', [100]*4)  # Default to 100% if not available
-            wheel_load = data.get('wheel_load', [0]*4)
-            
-            for i, (row, col) in enumerate([(0,0), (0,1), (1,0), (1,1)]):
-                widget_key = f'tire_{row}_{col}'
-                if widget_key in self.widgets:
-                    self.widgets[widget_key].update_data(
-                        pressure_bar=tire_pressure[i],
-                        temperature_c=tire_temp[i],
-                        wear_percent=tire_wear[i],
-                        load_n=wheel_load[i]
-                    )
-            
-            # Update G-Force
-            if 'gforce' in self.widgets:
-                g_lat = data.get('g_force_lateral', 0)
-                g_lon = data.get('g_force_longitudinal', 0)
-                self.widgets['gforce'].update_gforce(g_lat, g_lon)
-            
-            # Update fuel
-            if 'fuel' in self.widgets:
-                fuel = data.get('fuel', 0)
-                self.widgets['fuel'].update_fuel(fuel)
-            
-            # Update temperature
-            if 'temperature' in self.widgets:
-                water_temp = data.get('water_temp', 0)
-                oil_temp = data.get('oil_temp', 0)
-                self.widgets['temperature'].update_temperatures(water_temp, oil_temp)
-            
-        except Exception as e:
-            print(f"Error updating telemetry display: {e}")
+        # Update connection status
+        if connected != self._last_connected:
+            self._connection.update_status(connected)
+            self._last_connected = connected
+        
+        if not connected or not data:
+            return
+        
+        # Update speed
+        speed = (data.speed_kmh, data.speed_mph)
+        if speed != self._last_speed:
+            self._speed.update_speed(*speed)
+            self._last_speed = speed
+        
+        # Update RPM
+        rpm = (data.rpm, data.max_rpm, data.gear_recommendation)
+        if rpm != self._last_rpm:
+            self._rpm.update_rpm(*rpm)
+            self._last_rpm = rpm
+        
+        # Update gear
+        gear = data.gear
+        if gear != self._last_gear:
+            gear_text = _GEAR_STRINGS[gear + 1] if -1 <= gear <= 8 else str(gear)
+            self._gear_var.set(gear_text)
+            self._last_gear = gear
+        
+        # Update lap time
+        times = (data.lap_time, data.last_lap, data.best_lap)
+        if times != self._last_times:
+            self._lap_time.update_times(*times)
+            self._last_times = times
+        
+        # Update tire data
+        tires = (data.tire_pressure_psi_tenths, data.tire_temperature_core, data.tire_wear, data.wheel_load)
+        if tires != self._last_tires:
+            self._tires.update_all(*tires)
+            self._last_tires = tires
+        
+        # Update G-Force
+        gforce = (data.g_force_lateral, data.g_force_longitudinal)
+        if gforce != self._last_gforce:
+            self._gforce.update_gforce(*gforce)
+            self._last_gforce = gforce
+        
+        # Update fuel
+        if data.fuel != self._last_fuel:
+            self._fuel.update_fuel(data.fuel)
+            self._last_fuel = data.fuel
+        
+        # Update temperature
+        temps = (data.water_temp, data.oil_temp)
+        if temps != self._last_temps:
+            self._temperature.update_temperatures(*temps)
+            self._last_temps = temps
     
     def show_settings(self):
         """Show settings dialog"""
@@ -243,6 +281,7 @@ class MainWindow:
                 # Update configuration
                 self.dashboard_app.config.update(dialog.result)
                 self.dashboard_app.config_manager.save_config(self.dashboard_app.config)
+                self.dashboard_app.apply_logging_config()
                 
                 # Show restart message if needed
                 messagebox.showinfo("Settings", "Some settings require restart to take effect.")
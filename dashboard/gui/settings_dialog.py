@@ -2,22 +2,122 @@
 Settings Dialog for AC Telemetry Dashboard
 """
 
+import copy
+import json
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk, messagebox, filedialog
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+from dashboard.utils.config_manager import ConfigManager
+
+# Initial settings dialog size in pixels
+DIALOG_WIDTH = 600
+DIALOG_HEIGHT = 500
+
+@lru_cache(maxsize=1)
+def _default_config() -> Dict[str, Any]:
+    """Default configuration, built once per process"""
+    return ConfigManager().default_config
+
+def _flatten(config: Dict[str, Any], prefix: tuple = ()) -> Dict[tuple, Any]:
+    """Flatten a nested config into {('section', 'key'): value}, keeping subtrees too"""
+    flat = {}
+    for key, value in config.items():
+        path = prefix + (key,)
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path))
+    return flat
+
+
+# Last exported (config, JSON text); repeated exports of the same settings reuse the text
+_last_export: Optional[Tuple[Dict[str, Any], str]] = None
+
+def _serialize_config(config: Dict[str, Any]) -> str:
+    """Serialize a config for export, reusing the previous result if unchanged"""
+    global _last_export
+    if _last_export is not None and _last_export[0] == config:
+        return _last_export[1]
+    
+    if config['advanced']['performance_mode']:
+        # Compact one-shot encoding takes the C encoder path
+        text = json.dumps(config, separators=(',', ':'))
+    else:
+        text = json.dumps(config, indent=2)
+    _last_export = (config, text)
+    return text
+
+def _lookup(config: Dict[str, Any], path: tuple) -> Any:
+    """Return the value at a config path, or None if any key is missing"""
+    for key in path:
+        if not isinstance(config, dict) or key not in config:
+            return None
+        config = config[key]
+    return config
+
+def _assign(config: Dict[str, Any], path: tuple, value: Any):
+    """Set the value at a config path, creating intermediate sections"""
+    for key in path[:-1]:
+        config = config.setdefault(key, {})
+    config[path[-1]] = value
 
 class SettingsDialog:
     """Settings configuration dialog"""
     
+    # Config path -> attribute holding the Tk variable for that setting
+    _BINDINGS = (
+        (('udp', 'host'), 'udp_host_var'),
+        (('udp', 'port'), 'udp_port_var'),
+        (('udp', 'timeout'), 'udp_timeout_var'),
+        (('controls', 'port'), 'control_port_var'),
+        (('controls', 'enabled'), 'controls_enabled_var'),
+        (('window', 'always_on_top'), 'always_on_top_var'),
+        (('window', 'theme'), 'theme_var'),
+        (('display', 'update_rate'), 'update_rate_var'),
+        (('display', 'units', 'speed'), 'speed_unit_var'),
+        (('display', 'units', 'temperature'), 'temp_unit_var'),
+        (('display', 'units', 'pressure'), 'pressure_unit_var'),
+        (('logging', 'enabled'), 'logging_enabled_var'),
+        (('logging', 'directory'), 'log_dir_var'),
+        (('logging', 'format'), 'log_format_var'),
+        (('logging', 'max_file_size'), 'max_file_size_var'),
+        (('logging', 'max_files'), 'max_files_var'),
+        (('alerts', 'low_fuel_threshold'), 'low_fuel_var'),
+        (('alerts', 'high_temperature_threshold'), 'high_temp_var'),
+        (('alerts', 'tire_pressure_min'), 'tire_pressure_min_var'),
+        (('alerts', 'tire_pressure_max'), 'tire_pressure_max_var'),
+        (('alerts', 'sound_enabled'), 'sound_enabled_var'),
+        (('advanced', 'csp_support'), 'csp_support_var'),
+        (('advanced', 'extended_telemetry'), 'extended_telemetry_var'),
+        (('advanced', 'debug_mode'), 'debug_mode_var'),
+        (('advanced', 'performance_mode'), 'performance_mode_var'),
+    )
+    
+    # Tk variables reused across dialog instances, keyed by (type, attribute)
+    _var_pool: Dict[Tuple[type, str], tk.Variable] = {}
+    
+    # Config path -> default for settings the dialog does not edit
+    _PASSTHROUGH = (
+        (('udp', 'buffer_size'), 4096),
+        (('controls', 'host'), 'localhost'),
+        (('logging', 'flush_every'), 100),
+        (('window', 'geometry'), '1200x800'),
+        (('window', 'fullscreen'), False),
+        (('display', 'precision'), {}),
+        (('widgets',), {}),
+    )
+    
     def __init__(self, parent: tk.Widget, config: Dict[str, Any]):
         self.parent = parent
-        self.config = config.copy()
+        # The caller's config is only read; pass-through subtrees are copied on save
+        self.config = config
+        self._flat = _flatten(config)
         self.result = None
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Dashboard Settings")
-        self.dialog.geometry("600x500")
         self.dialog.resizable(True, True)
         self.dialog.transient(parent)
         self.dialog.grab_set()
@@ -33,35 +133,37 @@ class SettingsDialog:
     
     def center_dialog(self):
         """Center dialog on parent window"""
-        self.dialog.update_idletasks()
-        
         # Get parent position and size
         parent_x = self.parent.winfo_rootx()
         parent_y = self.parent.winfo_rooty()
         parent_width = self.parent.winfo_width()
         parent_height = self.parent.winfo_height()
         
-        # Calculate center position
-        dialog_width = self.dialog.winfo_reqwidth()
-        dialog_height = self.dialog.winfo_reqheight()
+        # The dialog size is fixed, so no layout pass is needed to measure it
+        x = parent_x + (parent_width // 2) - (DIALOG_WIDTH // 2)
+        y = parent_y + (parent_height // 2) - (DIALOG_HEIGHT // 2)
         
-        x = parent_x + (parent_width // 2) - (dialog_width // 2)
-        y = parent_y + (parent_height // 2) - (dialog_height // 2)
-        
-        self.dialog.geometry(f"+{x}+{y}")
+        self.dialog.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}+{x}+{y}")
     
     def setup_dialog(self):
         """Setup dialog layout"""
         # Create notebook for tabs
-        notebook = ttk.Notebook(self.dialog)
-        notebook.pack(fill='both', expand=True, padx=10, pady=10)
-        
-        # Create tabs
-        self.create_connection_tab(notebook)
-        self.create_display_tab(notebook)
-        self.create_logging_tab(notebook)
-        self.create_alerts_tab(notebook)
-        self.create_advanced_tab(notebook)
+        self.notebook = ttk.Notebook(self.dialog)
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Create tabs; contents are built the first time a tab is selected
+        self._tab_builders = {}
+        for title, builder in (("Connection", self.create_connection_tab),
+                               ("Display", self.create_display_tab),
+                               ("Logging", self.create_logging_tab),
+                               ("Alerts", self.create_alerts_tab),
+                               ("Advanced", self.create_advanced_tab)):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self._tab_builders[str(frame)] = (frame, builder)
+        
+        self._build_tab(self.notebook.select())
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Button frame
         button_frame = ttk.Frame(self.dialog)
@@ -77,28 +179,54 @@ class SettingsDialog:
         ttk.Button(button_frame, text="Import...", command=self.import_config).pack(side='left', padx=(5, 0))
         ttk.Button(button_frame, text="Reset to Defaults", command=self.reset_defaults).pack(side='left', padx=(5, 0))
     
-    def create_connection_tab(self, notebook):
+    def _make_var(self, var_type: type, name: str, value: Any) -> tk.Variable:
+        """Return a pooled Tk variable set to value, creating it on first use"""
+        key = (var_type, name)
+        var = SettingsDialog._var_pool.get(key)
+        # Variables belong to the interpreter that created them; setting one
+        # from a destroyed root does not fail, so check ownership explicitly
+        if var is not None and var._tk is self.dialog.tk:
+            var.set(value)
+            return var
+        var = var_type(self.dialog, value=value)
+        SettingsDialog._var_pool[key] = var
+        return var
+    
+    def _build_tab(self, tab_id: str):
+        """Build the contents of a tab if it has not been built yet"""
+        entry = self._tab_builders.pop(tab_id, None)
+        if entry is not None:
+            frame, builder = entry
+            builder(frame)
+    
+    def _build_all_tabs(self):
+        """Build any remaining tabs so every setting variable exists"""
+        for tab_id in list(self._tab_builders):
+            self._build_tab(tab_id)
+    
+    def _on_tab_changed(self, event):
+        """Build the newly selected tab on first view"""
+        self._build_tab(self.notebook.select())
+    
+    def create_connection_tab(self, frame: ttk.Frame):
         """Create connection settings tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Connection")
-        
         # UDP Settings
         udp_group = ttk.LabelFrame(frame, text="UDP Telemetry")
         udp_group.pack(fill='x', padx=10, pady=10)
         
         # Host
         ttk.Label(udp_group, text="Host:").grid(row=0, column=0, sticky='w', padx=5, pady=5)
-        self.udp_host_var = tk.StringVar(value=self.config.get('udp', {}).get('host', 'localhost'))
+        self.udp_host_var = self._make_var(tk.StringVar, 'udp_host_var', self._flat.get(('udp', 'host'), 'localhost'))
         ttk.Entry(udp_group, textvariable=self.udp_host_var, width=20).grid(row=0, column=1, padx=5, pady=5)
         
         # Port
         ttk.Label(udp_group, text="Port:").grid(row=1, column=0, sticky='w', padx=5, pady=5)
-        self.udp_port_var = tk.IntVar(value=self.config.get('udp', {}).get('port', 9996))
+        self.udp_port_var = self._make_var(tk.IntVar, 'udp_port_var', self._flat.get(('udp', 'port'), 9996))
         ttk.Spinbox(udp_group, from_=1024, to=65535, textvariable=self.udp_port_var, width=18).grid(row=1, column=1, padx=5, pady=5)
         
         # Timeout
         ttk.Label(udp_group, text="Timeout (s):").grid(row=2, column=0, sticky='w', padx=5, pady=5)
-        self.udp_timeout_var = tk.DoubleVar(value=self.config.get('udp', {}).get('timeout', 1.0))
+        self.udp_timeout_var = self._make_var(tk.DoubleVar, 'udp_timeout_var', self._flat.get(('udp', 'timeout'), 1.0))
         ttk.Spinbox(udp_group, from_=0.1, to=10.0, increment=0.1, textvariable=self.udp_timeout_var, width=18).grid(row=2, column=1, padx=5, pady=5)
         
         # Control Settings
@@ -106,25 +234,22 @@ class SettingsDialog:
         control_group.pack(fill='x', padx=10, pady=10)
         
         # Enable controls
-        self.controls_enabled_var = tk.BooleanVar(value=self.config.get('controls', {}).get('enabled', True))
-        ttk.Checkbutton(control_group, text="Enable vehicle controls", variable=self.controls_enabled_var).pack(anchor='w', padx=5, pady=5)
+        self.controls_enabled_var = self._make_var(tk.BooleanVar, 'controls_enabled_var', self._flat.get(('controls', 'enabled'), True))
+        ttk.Checkbutton(control_group, text="Enable vehicle controls", variable=self.controls_enabled_var).grid(row=0, column=0, columnspan=2, sticky='w', padx=5, pady=5)
         
         # Control port
         ttk.Label(control_group, text="Control Port:").grid(row=1, column=0, sticky='w', padx=5, pady=5)
-        self.control_port_var = tk.IntVar(value=self.config.get('controls', {}).get('port', 9997))
+        self.control_port_var = self._make_var(tk.IntVar, 'control_port_var', self._flat.get(('controls', 'port'), 9997))
         ttk.Spinbox(control_group, from_=1024, to=65535, textvariable=self.control_port_var, width=18).grid(row=1, column=1, padx=5, pady=5)
     
-    def create_display_tab(self, notebook):
+    def create_display_tab(self, frame: ttk.Frame):
         """Create display settings tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Display")
-        
         # Update Rate
         update_group = ttk.LabelFrame(frame, text="Update Settings")
         update_group.pack(fill='x', padx=10, pady=10)
         
         ttk.Label(update_group, text="Update Rate (Hz):").grid(row=0, column=0, sticky='w', padx=5, pady=5)
-        self.update_rate_var = tk.IntVar(value=self.config.get('display', {}).get('update_rate', 20))
+        self.update_rate_var = self._make_var(tk.IntVar, 'update_rate_var', self._flat.get(('display', 'update_rate'), 20))
         ttk.Spinbox(update_group, from_=1, to=60, textvariable=self.update_rate_var, width=18).grid(row=0, column=1, padx=5, pady=5)
         
         # Units
@@ -133,19 +258,19 @@ class SettingsDialog:
         
         # Speed units
         ttk.Label(units_group, text="Speed:").grid(row=0, column=0, sticky='w', padx=5, pady=5)
-        self.speed_unit_var = tk.StringVar(value=self.config.get('display', {}).get('units', {}).get('speed', 'kmh'))
+        self.speed_unit_var = self._make_var(tk.StringVar, 'speed_unit_var', self._flat.get(('display', 'units', 'speed'), 'kmh'))
         speed_combo = ttk.Combobox(units_group, textvariable=self.speed_unit_var, values=['kmh', 'mph'], state='readonly', width=15)
         speed_combo.grid(row=0, column=1, padx=5, pady=5)
         
         # Temperature units
         ttk.Label(units_group, text="Temperature:").grid(row=1, column=0, sticky='w', padx=5, pady=5)
-        self.temp_unit_var = tk.StringVar(value=self.config.get('display', {}).get('units', {}).get('temperature', 'celsius'))
+        self.temp_unit_var = self._make_var(tk.StringVar, 'temp_unit_var', self._flat.get(('display', 'units', 'temperature'), 'celsius'))
         temp_combo = ttk.Combobox(units_group, textvariable=self.temp_unit_var, values=['celsius', 'fahrenheit'], state='readonly', width=15)
         temp_combo.grid(row=1, column=1, padx=5, pady=5)
         
         # Pressure units
         ttk.Label(units_group, text="Pressure:").grid(row=2, column=0, sticky='w', padx=5, pady=5)
-        self.pressure_unit_var = tk.StringVar(value=self.config.get('display', {}).get('units', {}).get('pressure', 'bar'))
+        self.pressure_unit_var = self._make_var(tk.StringVar, 'pressure_unit_var', self._flat.get(('display', 'units', 'pressure'), 'bar'))
         pressure_combo = ttk.Combobox(units_group, textvariable=self.pressure_unit_var, values=['bar', 'psi'], state='readonly', width=15)
         pressure_combo.grid(row=2, column=1, padx=5, pady=5)
         
@@ -155,21 +280,18 @@ class SettingsDialog:
         
         # Theme
         ttk.Label(window_group, text="Theme:").grid(row=0, column=0, sticky='w', padx=5, pady=5)
-        self.theme_var = tk.StringVar(value=self.config.get('window', {}).get('theme', 'dark'))
+        self.theme_var = self._make_var(tk.StringVar, 'theme_var', self._flat.get(('window', 'theme'), 'dark'))
         theme_combo = ttk.Combobox(window_group, textvariable=self.theme_var, values=['dark', 'light'], state='readonly', width=15)
         theme_combo.grid(row=0, column=1, padx=5, pady=5)
         
         # Always on top
-        self.always_on_top_var = tk.BooleanVar(value=self.config.get('window', {}).get('always_on_top', False))
+        self.always_on_top_var = self._make_var(tk.BooleanVar, 'always_on_top_var', self._flat.get(('window', 'always_on_top'), False))
         ttk.Checkbutton(window_group, text="Always on top", variable=self.always_on_top_var).grid(row=1, column=0, columnspan=2, sticky='w', padx=5, pady=5)
     
-    def create_logging_tab(self, notebook):
+    def create_logging_tab(self, frame: ttk.Frame):
         """Create logging settings tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Logging")
-        
         # Enable logging
-        self.logging_enabled_var = tk.BooleanVar(value=self.config.get('logging', {}).get('enabled', False))
+        self.logging_enabled_var = self._make_var(tk.BooleanVar, 'logging_enabled_var', self._flat.get(('logging', 'enabled'), False))
         ttk.Checkbutton(frame, text="Enable telemetry logging", variable=self.logging_enabled_var).pack(anchor='w', padx=10, pady=10)
         
         # Logging settings
@@ -178,85 +300,79 @@ class SettingsDialog:
         
         # Log directory
         ttk.Label(logging_group, text="Log Directory:").grid(row=0, column=0, sticky='w', padx=5, pady=5)
-        self.log_dir_var = tk.StringVar(value=self.config.get('logging', {}).get('directory', 'logs'))
+        self.log_dir_var = self._make_var(tk.StringVar, 'log_dir_var', self._flat.get(('logging', 'directory'), 'logs'))
         ttk.Entry(logging_group, textvariable=self.log_dir_var, width=30).grid(row=0, column=1, padx=5, pady=5)
         ttk.Button(logging_group, text="Browse...", command=self.browse_log_directory).grid(row=0, column=2, padx=5, pady=5)
         
         # Log format
         ttk.Label(logging_group, text="Format:").grid(row=1, column=0, sticky='w', padx=5, pady=5)
-        self.log_format_var = tk.StringVar(value=self.config.get('logging', {}).get('format', 'csv'))
+        self.log_format_var = self._make_var(tk.StringVar, 'log_format_var', self._flat.get(('logging', 'format'), 'csv'))
         format_combo = ttk.Combobox(logging_group, textvariable=self.log_format_var, values=['csv', 'motec'], state='readonly', width=27)
         format_combo.grid(row=1, column=1, padx=5, pady=5)
         
         # Max file size
         ttk.Label(logging_group, text="Max File Size (MB):").grid(row=2, column=0, sticky='w', padx=5, pady=5)
-        self.max_file_size_var = tk.IntVar(value=self.config.get('logging', {}).get('max_file_size', 100))
+        self.max_file_size_var = self._make_var(tk.IntVar, 'max_file_size_var', self._flat.get(('logging', 'max_file_size'), 100))
         ttk.Spinbox(logging_group, from_=1, to=1000, textvariable=self.max_file_size_var, width=25).grid(row=2, column=1, padx=5, pady=5)
         
         # Max files
         ttk.Label(logging_group, text="Max Files:").grid(row=3, column=0, sticky='w', padx=5, pady=5)
-        self.max_files_var = tk.IntVar(value=self.config.get('logging', {}).get('max_files', 10))
+        self.max_files_var = self._make_var(tk.IntVar, 'max_files_var', self._flat.get(('logging', 'max_files'), 10))
         ttk.Spinbox(logging_group, from_=1, to=100, textvariable=self.max_files_var, width=25).grid(row=3, column=1, padx=5, pady=5)
     
-    def create_alerts_tab(self, notebook):
+    def create_alerts_tab(self, frame: ttk.Frame):
         """Create alerts settings tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Alerts")
-        
         # Alert thresholds
         alerts_group = ttk.LabelFrame(frame, text="Alert Thresholds")
         alerts_group.pack(fill='x', padx=10, pady=10)
         
         # Low fuel threshold
         ttk.Label(alerts_group, text="Low Fuel (L):").grid(row=0, column=0, sticky='w', padx=5, pady=5)
-        self.low_fuel_var = tk.DoubleVar(value=self.config.get('alerts', {}).get('low_fuel_threshold', 5.0))
+        self.low_fuel_var = self._make_var(tk.DoubleVar, 'low_fuel_var', self._flat.get(('alerts', 'low_fuel_threshold'), 5.0))
         ttk.Spinbox(alerts_group, from_=0.0, to=50.0, increment=0.5, textvariable=self.low_fuel_var, width=18).grid(row=0, column=1, padx=5, pady=5)
         
         # High temperature threshold
         ttk.Label(alerts_group, text="High Temp (°C):").grid(row=1, column=0, sticky='w', padx=5, pady=5)
-        self.high_temp_var = tk.DoubleVar(value=self.config.get('alerts', {}).get('high_temperature_threshold', 105.0))
+        self.high_temp_var = self._make_var(tk.DoubleVar, 'high_temp_var', self._flat.get(('alerts', 'high_temperature_threshold'), 105.0))
         ttk.Spinbox(alerts_group, from_=80.0, to=150.0, increment=1.0, textvariable=self.high_temp_var, width=18).grid(row=1, column=1, padx=5, pady=5)
         
         # Tire pressure range
         ttk.Label(alerts_group, text="Tire Pressure Min (PSI):").grid(row=2, column=0, sticky='w', padx=5, pady=5)
-        self.tire_pressure_min_var = tk.DoubleVar(value=self.config.get('alerts', {}).get('tire_pressure_min', 24.0))
+        self.tire_pressure_min_var = self._make_var(tk.DoubleVar, 'tire_pressure_min_var', self._flat.get(('alerts', 'tire_pressure_min'), 24.0))
         ttk.Spinbox(alerts_group, from_=15.0, to=35.0, increment=0.5, textvariable=self.tire_pressure_min_var, width=18).grid(row=2, column=1, padx=5, pady=5)
         
         ttk.Label(alerts_group, text="Tire Pressure Max (PSI):").grid(row=3, column=0, sticky='w', padx=5, pady=5)
-        self.tire_pressure_max_var = tk.DoubleVar(value=self.config.get('alerts', {}).get('tire_pressure_max', 32.0))
+        self.tire_pressure_max_var = self._make_var(tk.DoubleVar, 'tire_pressure_max_var', self._flat.get(('alerts', 'tire_pressure_max'), 32.0))
         ttk.Spinbox(alerts_group, from_=25.0, to=45.0, increment=0.5, textvariable=self.tire_pressure_max_var, width=18).grid(row=3, column=1, padx=5, pady=5)
         
         # Sound alerts
-        self.sound_enabled_var = tk.BooleanVar(value=self.config.get('alerts', {}).get('sound_enabled', True))
+        self.sound_enabled_var = self._make_var(tk.BooleanVar, 'sound_enabled_var', self._flat.get(('alerts', 'sound_enabled'), True))
         ttk.Checkbutton(frame, text="Enable sound alerts", variable=self.sound_enabled_var).pack(anchor='w', padx=10, pady=10)
     
-    def create_advanced_tab(self, notebook):
+    def create_advanced_tab(self, frame: ttk.Frame):
         """Create advanced settings tab"""
-        frame = ttk.Frame(notebook)
-        notebook.add(frame, text="Advanced")
-        
         # CSP Support
         csp_group = ttk.LabelFrame(frame, text="Custom Shaders Patch")
         csp_group.pack(fill='x', padx=10, pady=10)
         
-        self.csp_support_var = tk.BooleanVar(value=self.config.get('advanced', {}).get('csp_support', True))
+        self.csp_support_var = self._make_var(tk.BooleanVar, 'csp_support_var', self._flat.get(('advanced', 'csp_support'), True))
         ttk.Checkbutton(csp_group, text="Enable CSP support", variable=self.csp_support_var).pack(anchor='w', padx=5, pady=5)
         
-        self.extended_telemetry_var = tk.BooleanVar(value=self.config.get('advanced', {}).get('extended_telemetry', True))
+        self.extended_telemetry_var = self._make_var(tk.BooleanVar, 'extended_telemetry_var', self._flat.get(('advanced', 'extended_telemetry'), True))
         ttk.Checkbutton(csp_group, text="Use extended telemetry channels", variable=self.extended_telemetry_var).pack(anchor='w', padx=5, pady=5)
         
         # Debug settings
         debug_group = ttk.LabelFrame(frame, text="Debug")
         debug_group.pack(fill='x', padx=10, pady=10)
         
-        self.debug_mode_var = tk.BooleanVar(value=self.config.get('advanced', {}).get('debug_mode', False))
+        self.debug_mode_var = self._make_var(tk.BooleanVar, 'debug_mode_var', self._flat.get(('advanced', 'debug_mode'), False))
         ttk.Checkbutton(debug_group, text="Enable debug mode", variable=self.debug_mode_var).pack(anchor='w', padx=5, pady=5)
         
         # Performance settings
         perf_group = ttk.LabelFrame(frame, text="Performance")
         perf_group.pack(fill='x', padx=10, pady=10)
         
-        self.performance_mode_var = tk.BooleanVar(value=self.config.get('advanced', {}).get('performance_mode', False))
+        self.performance_mode_var = self._make_var(tk.BooleanVar, 'performance_mode_var', self._flat.get(('advanced', 'performance_mode'), False))
         ttk.Checkbutton(perf_group, text="Performance mode (reduced visual effects)", variable=self.performance_mode_var).pack(anchor='w', padx=5, pady=5)
     
     def browse_log_directory(self):
@@ -277,10 +393,9 @@ class SettingsDialog:
         )
         if filename:
             try:
-                config = self.get_config_from_dialog()
-                import json
+                text = _serialize_config(self.get_config_from_dialog())
                 with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(config, f, indent=2)
+                    f.write(text)
                 messagebox.showinfo("Export", f"Configuration exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Export Error", f"Failed to export configuration:\n{e}")
@@ -293,7 +408,6 @@ class SettingsDialog:
         )
         if filename:
             try:
-                import json
                 with open(filename, 'r', encoding='utf-8') as f:
                     imported_config = json.load(f)
                 
@@ -308,146 +422,39 @@ class SettingsDialog:
         """Reset all settings to defaults"""
         if messagebox.askyesno("Reset to Defaults", "Are you sure you want to reset all settings to defaults?"):
             # Reset to default config
-            from dashboard.utils.config_manager import ConfigManager
-            config_manager = ConfigManager()
-            default_config = config_manager.default_config
+            default_config = copy.deepcopy(_default_config())
             
             self.update_dialog_from_config(default_config)
             messagebox.showinfo("Reset", "Settings reset to defaults")
     
     def update_dialog_from_config(self, config: Dict[str, Any]):
         """Update dialog controls from configuration"""
+        self._build_all_tabs()
         try:
-            # UDP settings
-            udp_config = config.get('udp', {})
-            if 'host' in udp_config:
-                self.udp_host_var.set(udp_config['host'])
-            if 'port' in udp_config:
-                self.udp_port_var.set(udp_config['port'])
-            if 'timeout' in udp_config:
-                self.udp_timeout_var.set(udp_config['timeout'])
-            
-            # Controls settings
-            controls_config = config.get('controls', {})
-            if 'enabled' in controls_config:
-                self.controls_enabled_var.set(controls_config['enabled'])
-            if 'port' in controls_config:
-                self.control_port_var.set(controls_config['port'])
-            
-            # Display settings
-            display_config = config.get('display', {})
-            if 'update_rate' in display_config:
-                self.update_rate_var.set(display_config['update_rate'])
-            
-            units_config = display_config.get('units', {})
-            if 'speed' in units_config:
-                self.speed_unit_var.set(units_config['speed'])
-            if 'temperature' in units_config:
-                self.temp_unit_var.set(units_config['temperature'])
-            if 'pressure' in units_config:
-                self.pressure_unit_var.set(units_config['pressure'])
-            
-            # Window settings
-            window_config = config.get('window', {})
-            if 'theme' in window_config:
-                self.theme_var.set(window_config['theme'])
-            if 'always_on_top' in window_config:
-                self.always_on_top_var.set(window_config['always_on_top'])
-            
-            # Logging settings
-            logging_config = config.get('logging', {})
-            if 'enabled' in logging_config:
-                self.logging_enabled_var.set(logging_config['enabled'])
-            if 'directory' in logging_config:
-                self.log_dir_var.set(logging_config['directory'])
-            if 'format' in logging_config:
-                self.log_format_var.set(logging_config['format'])
-            if 'max_file_size' in logging_config:
-                self.max_file_size_var.set(logging_config['max_file_size'])
-            if 'max_files' in logging_config:
-                self.max_files_var.set(logging_config['max_files'])
-            
-            # Alert settings
-            alerts_config = config.get('alerts', {})
-            if 'low_fuel_threshold' in alerts_config:
-                self.low_fuel_var.set(alerts_config['low_fuel_threshold'])
-            if 'high_temperature_threshold' in alerts_config:
-                self.high_temp_var.set(alerts_config['high_temperature_threshold'])
-            if 'tire_pressure_min' in alerts_config:
-                self.tire_pressure_min_var.set(alerts_config['tire_pressure_min'])
-            if 'tire_pressure_max' in alerts_config:
-                self.tire_pressure_max_var.set(alerts_config['tire_pressure_max'])
-            if 'sound_enabled' in alerts_config:
-                self.sound_enabled_var.set(alerts_config['sound_enabled'])
-            
-            # Advanced settings
-            advanced_config = config.get('advanced', {})
-            if 'csp_support' in advanced_config:
-                self.csp_support_var.set(advanced_config['csp_support'])
-            if 'extended_telemetry' in advanced_config:
-                self.extended_telemetry_var.set(advanced_config['extended_telemetry'])
-            if 'debug_mode' in advanced_config:
-                self.debug_mode_var.set(advanced_config['debug_mode'])
-            if 'performance_mode' in advanced_config:
-                self.performance_mode_var.set(advanced_config['performance_mode'])
+            for path, attr in self._BINDINGS:
+                value = _lookup(config, path)
+                if value is not None:
+                    getattr(self, attr).set(value)
                 
         except Exception as e:
             print(f"Error updating dialog from config: {e}")
     
     def get_config_from_dialog(self) -> Dict[str, Any]:
         """Get configuration from dialog controls"""
-        return {
-            'udp': {
-                'host': self.udp_host_var.get(),
-                'port': self.udp_port_var.get(),
-                'timeout': self.udp_timeout_var.get(),
-                'buffer_size': self.config.get('udp', {}).get('buffer_size', 4096)
-            },
-            'controls': {
-                'host': self.config.get('controls', {}).get('host', 'localhost'),
-                'port': self.control_port_var.get(),
-                'enabled': self.controls_enabled_var.get()
-            },
-            'window': {
-                'geometry': self.config.get('window', {}).get('geometry', '1200x800'),
-                'fullscreen': self.config.get('window', {}).get('fullscreen', False),
-                'always_on_top': self.always_on_top_var.get(),
-                'theme': self.theme_var.get()
-            },
-            'display': {
-                'update_rate': self.update_rate_var.get(),
-                'units': {
-                    'speed': self.speed_unit_var.get(),
-                    'temperature': self.temp_unit_var.get(),
-                    'pressure': self.pressure_unit_var.get()
-                },
-                'precision': self.config.get('display', {}).get('precision', {})
-            },
-            'widgets': self.config.get('widgets', {}),
-            'logging': {
-                'enabled': self.logging_enabled_var.get(),
-                'directory': self.log_dir_var.get(),
-                'format': self.log_format_var.get(),
-                'max_file_size': self.max_file_size_var.get(),
-                'max_files': self.max_files_var.get()
-            },
-            'alerts': {
-                'low_fuel_threshold': self.low_fuel_var.get(),
-                'high_temperature_threshold': self.high_temp_var.get(),
-                'tire_pressure_min': self.tire_pressure_min_var.get(),
-                'tire_pressure_max': self.tire_pressure_max_var.get(),
-                'sound_enabled': self.sound_enabled_var.get()
-            },
-            'advanced': {
-                'csp_support': self.csp_support_var.get(),
-                'extended_telemetry': self.extended_telemetry_var.get(),
-                'debug_mode': self.debug_mode_var.get(),
-                'performance_mode': self.performance_mode_var.get()
-            }
-        }
+        self._build_all_tabs()
+        config = {}
+        for path, attr in self._BINDINGS:
+            _assign(config, path, getattr(self, attr).get())
+        
+        # Settings without a control are carried over from the current config
+        for path, default in self._PASSTHROUGH:
+            _assign(config, path, copy.deepcopy(self._flat.get(path, default)))
+        
+        return config
     
     def validate_settings(self) -> tuple[bool, str]:
         """Validate settings and return (is_valid, error_message)"""
+        self._build_all_tabs()
         try:
             # Validate ports
             udp_port = self.udp_port_var.get()
@@ -456,11 +463,8 @@ class SettingsDialog:
             if udp_port == control_port:
                 return False, "UDP and Control ports cannot be the same"
             
-            if not (1024 <= udp_port <= 65535):
-                return False, "UDP port must be between 1024 and 65535"
-            
-            if not (1024 <= control_port <= 65535):
-                return False, "Control port must be between 1024 and 65535"
+            if not (1024 <= udp_port <= 65535 and 1024 <= control_port <= 65535):
+                return False, "UDP and Control ports must be between 1024 and 65535"
             
             # Validate tire pressure range
             min_pressure = self.tire_pressure_min_var.get()
@@ -4,22 +4,194 @@ Telemetry Display Widgets for AC Dashboard
 
 import tkinter as tk
 from tkinter import ttk, Canvas
-from typing import Optional, List
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, partial
+from typing import Optional, List, Tuple
 import math
 
+# Colour bands for two-sided ranges: (lower bounds, upper bounds), both inclusive.
+# Severity is how many bands a value is outside the optimal window.
+_SEVERITY_COLORS = ('green', 'yellow', 'red')
+_TIRE_PRESSURE_BANDS = ((24.0, 26.0), (29.0, 31.0))  # PSI
+_TIRE_TEMP_BANDS = ((70.0, 80.0), (110.0, 120.0))  # °C
+
+# Engine temperatures: below the cold limit is light blue, otherwise by hot thresholds
+_HOT_COLORS = ('green', 'yellow', 'red')
+_WATER_TEMP_COLD = 80
+_WATER_TEMP_HOT = (95, 105)
+_OIL_TEMP_COLD = 90
+_OIL_TEMP_HOT = (110, 120)
+
+# Three-zone colours indexed by how many thresholds a value exceeds
+_RISING_COLORS = ('green', 'yellow', 'red')   # higher is worse (load, G-force)
+_FALLING_COLORS = ('red', 'yellow', 'green')  # higher is better (wear, fuel)
+
+def _zone_color(value: float, low: float, high: float, colors) -> str:
+    """Pick a zone colour without branching: index is (value > low) + (value > high)"""
+    return colors[(value > low) + (value > high)]
+
+def _zone_color_from(value: float, low: float, high: float, colors) -> str:
+    """Like _zone_color, but a value exactly on a bound falls in the upper zone"""
+    return colors[(value >= low) + (value >= high)]
+
+# RPM gauge zones: yellow above 70% of max RPM, red above 85%
+_RPM_ZONE_BOUNDS = (0.7, 0.85)
+
+def rpm_color_extent(rpm: float, max_rpm: float) -> Tuple[str, float]:
+    """Gauge colour and arc extent in degrees (0-180) for an RPM reading"""
+    ratio = min(rpm / max_rpm, 1.0) if max_rpm > 0 else 0.0
+    return _RISING_COLORS[bisect_left(_RPM_ZONE_BOUNDS, ratio)], ratio * 180.0
+
+# Label text for bounded integer readings, built once at import; values
+# outside a table's range are formatted on the fly
+_SPEED_STRS = tuple(str(i) for i in range(401))
+_MPH_STRS = tuple(f"({i} MPH)" for i in range(251))
+_RPM_STRS = tuple(str(i) for i in range(15001))
+_TEMP_MIN = -40
+_TEMP_STRS = tuple(f"{i}°C" for i in range(_TEMP_MIN, 201))
+
+def _kmh_text(kmh: int) -> str:
+    return _SPEED_STRS[kmh] if 0 <= kmh < len(_SPEED_STRS) else str(kmh)
+
+def _mph_text(mph: int) -> str:
+    return _MPH_STRS[mph] if 0 <= mph < len(_MPH_STRS) else f"({mph} MPH)"
+
+def _rpm_text(rpm: int) -> str:
+    return _RPM_STRS[rpm] if 0 <= rpm < len(_RPM_STRS) else str(rpm)
+
+def _degrees_text(degrees: int) -> str:
+    index = degrees - _TEMP_MIN
+    return _TEMP_STRS[index] if 0 <= index < len(_TEMP_STRS) else f"{degrees}°C"
+
+# Formatted label text keyed by the value rounded to display precision, so
+# unchanged readings reuse the same string instead of re-running the formatter
+
+@lru_cache(maxsize=1024)
+def _liters_text(tenths: int) -> str:
+    return f"{tenths / 10:.1f} L"
+
+@lru_cache(maxsize=1024)
+def _g_text(hundredths: int) -> str:
+    return f"{hundredths / 100:.2f}g"
+
+# Value label styles per foreground colour (configured in MainWindow.setup_style)
+_VALUE_LABEL_STYLES = {
+    'green': 'Green.Value.TLabel',
+    'yellow': 'Yellow.Value.TLabel',
+    'red': 'Red.Value.TLabel',
+    'lightblue': 'LightBlue.Value.TLabel',
+}
+
+# Progress bar styles per colour zone (configured in MainWindow.setup_style)
+_FUEL_BAR_STYLES = {
+    'green': 'Green.Horizontal.TProgressbar',
+    'yellow': 'Yellow.Horizontal.TProgressbar',
+    'red': 'Red.Horizontal.TProgressbar',
+}
+_WEAR_BAR_STYLES = {color: f'Wear.{style}' for color, style in _FUEL_BAR_STYLES.items()}
+
+def _band_color(value: float, bands) -> str:
+    """Colour for a value checked against inclusive (lows, highs) bands"""
+    # NaN fails every band check, so it is out of range; bisect would place it first
+    if not math.isfinite(value):
+        return 'red'
+    lows, highs = bands
+    return _SEVERITY_COLORS[max(len(lows) - bisect_right(lows, value), bisect_left(highs, value))]
+
 class BaseWidget(ttk.Frame):
     """Base class for all telemetry widgets"""
     
+    # Subclasses that lay out label/value rows with grid set this so the
+    # title is gridded too (pack and grid cannot share a master)
+    _grid_layout = False
+    
     def __init__(self, parent, title: str = "", **kwargs):
         super().__init__(parent, style='Dashboard.TFrame', **kwargs)
         self.title = title
+        # label -> (text, style) last pushed to Tk
+        self._label_cache = {}
+        # label -> StringVar holding its text
+        self._label_vars = {}
+        
+        # Updates received while hidden are held back; only the latest is kept
+        self._visible = True
+        self._pending = None
+        self.bind('<Map>', self._on_map, add='+')
+        self.bind('<Unmap>', self._on_unmap, add='+')
+        self.winfo_toplevel().bind('<Map>', self._on_map, add='+')
+        self.winfo_toplevel().bind('<Unmap>', self._on_unmap, add='+')
+        
         self.setup_widget()
     
     def setup_widget(self):
         """Setup the basic widget structure"""
+        if self._grid_layout:
+            # Labels in column 0, values pushed to the right edge in column 1
+            self.columnconfigure(1, weight=1)
+        
         if self.title:
             title_label = ttk.Label(self, text=self.title, style='Title.TLabel')
-            title_label.pack(pady=(0, 5))
+            if self._grid_layout:
+                title_label.grid(row=0, column=0, columnspan=2, pady=(0, 5))
+            else:
+                title_label.pack(pady=(0, 5))
+    
+    def _on_map(self, event):
+        """Widget or its window became visible; apply any held-back update"""
+        if event.widget is not self and event.widget is not self.winfo_toplevel():
+            return
+        self._visible = True
+        self._flush_pending()
+    
+    def _on_unmap(self, event):
+        """Widget or its window was hidden (e.g. minimized)"""
+        if event.widget is self or event.widget is self.winfo_toplevel():
+            self._visible = False
+    
+    def _defer(self, method, *args) -> bool:
+        """Hold back an update while hidden; returns True if it was deferred"""
+        if self._visible:
+            return False
+        self._pending = (method, args)
+        return True
+    
+    def _flush_pending(self):
+        """Apply the most recent update received while hidden"""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            method, args = pending
+            method(*args)
+    
+    @staticmethod
+    def _canvas_command(canvas: Canvas):
+        """Return a callable issuing Tcl subcommands on canvas directly, bypassing
+        the option-parsing wrappers of Canvas.coords/itemconfig"""
+        return partial(canvas.tk.call, str(canvas))
+    
+    def _value_label(self, parent, text: str, **options) -> ttk.Label:
+        """Create a value label whose text is held in a StringVar"""
+        var = tk.StringVar(self, value=text)
+        label = ttk.Label(parent, textvariable=var, **options)
+        self._label_vars[label] = var
+        return label
+    
+    def _set_label(self, label: ttk.Label, text: str, style: Optional[str] = None):
+        """Update a value label, touching only what changed since the last update.
+        
+        Text goes through the label's StringVar, which redraws the label without
+        a configure call. Colour changes switch the label to another preconfigured
+        style, so only a zone change reconfigures the label.
+        """
+        last_text, last_style = self._label_cache.get(label, (None, None))
+        if text == last_text and (style is None or style == last_style):
+            return
+        if text != last_text:
+            self._label_vars[label].set(text)
+        if style is not None and style != last_style:
+            label.configure(style=style)
+        else:
+            style = last_style
+        self._label_cache[label] = (text, style)
 
 class ConnectionWidget(BaseWidget):
     """Widget showing connection status to AC"""
@@ -27,6 +199,7 @@ class ConnectionWidget(BaseWidget):
     def __init__(self, parent):
         super().__init__(parent, "CONNECTION")
         self.status_canvas = None
+        self._connected = False
         self.setup_connection_display()
     
     def setup_connection_display(self):
@@ -41,10 +214,16 @@ class ConnectionWidget(BaseWidget):
     
     def update_status(self, connected: bool):
         """Update connection status"""
-        if self.status_canvas and self.status_circle:
-            color = 'green' if connected else 'red'
-            outline_color = 'darkgreen' if connected else 'darkred'
-            self.status_canvas.itemconfig(self.status_circle, fill=color, outline=outline_color)
+        if self._defer(self.update_status, connected):
+            return
+        
+        if connected == self._connected:
+            return
+        self._connected = connected
+        
+        color = 'green' if connected else 'red'
+        outline_color = 'darkgreen' if connected else 'darkred'
+        self.status_canvas.itemconfig(self.status_circle, fill=color, outline=outline_color)
 
 class SpeedWidget(BaseWidget):
     """Widget displaying speed in KMH and MPH"""
@@ -58,29 +237,34 @@ class SpeedWidget(BaseWidget):
     def setup_speed_display(self):
         """Setup speed display"""
         # KMH display
-        self.speed_kmh_label = ttk.Label(self, text="0", 
-                                        font=('Arial', 20, 'bold'),
-                                        style='Value.TLabel')
+        self.speed_kmh_label = self._value_label(self, "0", 
+                                                font=('Arial', 20, 'bold'),
+                                                style='Value.TLabel')
         self.speed_kmh_label.pack()
         
         ttk.Label(self, text="KM/H", style='Unit.TLabel').pack()
         
         # MPH display (smaller)
-        self.speed_mph_label = ttk.Label(self, text="(0 MPH)", 
-                                        font=('Arial', 10),
-                                        style='Unit.TLabel')
+        self.speed_mph_label = self._value_label(self, "(0 MPH)", 
+                                                font=('Arial', 10),
+                                                style='Unit.TLabel')
         self.speed_mph_label.pack()
     
     def update_speed(self, kmh: float, mph: float):
         """Update speed display"""
-        if self.speed_kmh_label:
-            self.speed_kmh_label.config(text=f"{kmh:.0f}")
-        if self.speed_mph_label:
-            self.speed_mph_label.config(text=f"({mph:.0f} MPH)")
+        if self._defer(self.update_speed, kmh, mph):
+            return
+        
+        # round() raises on NaN/inf; format those as-is like the plain f-strings did
+        self._set_label(self.speed_kmh_label, _kmh_text(round(kmh)) if math.isfinite(kmh) else f"{kmh:.0f}")
+        self._set_label(self.speed_mph_label, _mph_text(round(mph)) if math.isfinite(mph) else f"({mph:.0f} MPH)")
 
 class RPMWidget(BaseWidget):
     """Widget displaying RPM with visual gauge"""
     
+    # Gauge arc bounding box on the 120x60 canvas
+    _ARC_BBOX = (10, 10, 110, 110)
+    
     def __init__(self, parent):
         super().__init__(parent, "RPM")
         self.rpm_label = None
@@ -94,117 +278,115 @@ class RPMWidget(BaseWidget):
                                   bg='#2d2d2d', highlightthickness=0)
         self.gauge_canvas.pack(pady=(0, 5))
         
+        # Gauge background and RPM arc; the arc is resized in place on update
+        self.gauge_canvas.create_arc(*self._ARC_BBOX, start=0, extent=180,
+                                    outline='#555555', width=3, style='arc')
+        self._rpm_arc_id = self.gauge_canvas.create_arc(*self._ARC_BBOX, start=0, extent=0,
+                                                       outline='green', width=5, style='arc')
+        self._gauge_cmd = self._canvas_command(self.gauge_canvas)
+        
         # RPM value
-        self.rpm_label = ttk.Label(self, text="0", 
-                                  font=('Arial', 16, 'bold'),
-                                  style='Value.TLabel')
+        self.rpm_label = self._value_label(self, "0", 
+                                          font=('Arial', 16, 'bold'),
+                                          style='Value.TLabel')
         self.rpm_label.pack()
         
         # Gear recommendation
-        self.gear_rec_label = ttk.Label(self, text="OPTIMAL", 
-                                       font=('Arial', 8),
-                                       style='Unit.TLabel')
+        self.gear_rec_label = self._value_label(self, "OPTIMAL", 
+                                               font=('Arial', 8),
+                                               style='Unit.TLabel')
         self.gear_rec_label.pack()
     
     def update_rpm(self, rpm: int, max_rpm: int, gear_recommendation: str):
         """Update RPM display and gauge"""
-        if self.rpm_label:
-            self.rpm_label.config(text=f"{rpm}")
+        if self._defer(self.update_rpm, rpm, max_rpm, gear_recommendation):
+            return
+        
+        self._set_label(self.rpm_label, _rpm_text(int(rpm)))
         
-        if self.gear_rec_label:
-            color = 'red' if 'SHIFT' in gear_recommendation else '#cccccc'
-            self.gear_rec_label.config(text=gear_recommendation, foreground=color)
+        style = 'Red.Unit.TLabel' if 'SHIFT' in gear_recommendation else 'Unit.TLabel'
+        self._set_label(self.gear_rec_label, gear_recommendation, style)
         
         # Update gauge
         self.draw_rpm_gauge(rpm, max_rpm)
     
     def draw_rpm_gauge(self, rpm: int, max_rpm: int):
         """Draw RPM gauge"""
-        if not self.gauge_canvas:
-            return
-        
-        self.gauge_canvas.delete("gauge")
-        
-        # Calculate angle (180 degrees total)
-        rpm_ratio = min(rpm / max_rpm, 1.0) if max_rpm > 0 else 0
-        angle = rpm_ratio * 180
-        
-        # Draw gauge background
-        self.gauge_canvas.create_arc(10, 10, 110, 110, start=0, extent=180,
-                                    outline='#555555', width=3, style='arc', tags="gauge")
-        
-        # Draw RPM arc
-        if rpm_ratio > 0.85:  # Red zone
-            color = 'red'
-        elif rpm_ratio > 0.7:  # Yellow zone
-            color = 'yellow'
-        else:  # Green zone
-            color = 'green'
-        
-        self.gauge_canvas.create_arc(10, 10, 110, 110, start=0, extent=angle,
-                                    outline=color, width=5, style='arc', tags="gauge")
+        color, angle = rpm_color_extent(rpm, max_rpm)
+        self._gauge_cmd('itemconfigure', self._rpm_arc_id, '-extent', angle, '-outline', color)
 
 class TireWidget(BaseWidget):
     """Widget displaying tire data (pressure, temperature, wear, load)"""
     
+    _grid_layout = True
+    
+    # Center of the load indicator on the 30x30 canvas
+    _LOAD_CENTER = 15
+    
     def __init__(self, parent, position: str):
         super().__init__(parent, position)
         self.position = position
         self.pressure_label = None
         self.temp_label = None
-        self.wear_canvas = None
+        self.wear_bar = None
+        self._wear_style = None
         self.load_canvas = None
         self.setup_tire_display()
     
     def setup_tire_display(self):
         """Setup tire data display"""
         # Pressure
-        pressure_frame = ttk.Frame(self, style='Dashboard.TFrame')
-        pressure_frame.pack(fill='x', pady=(0, 2))
-        
-        ttk.Label(pressure_frame, text="Pressure:", style='Unit.TLabel').pack(side='left')
-        self.pressure_label = ttk.Label(pressure_frame, text="0.0 PSI", 
-                                       font=('Arial', 10, 'bold'),
-                                       style='Value.TLabel')
-        self.pressure_label.pack(side='right')
+        ttk.Label(self, text="Pressure:", style='Unit.TLabel').grid(row=1, column=0, sticky='w', pady=(0, 2))
+        self.pressure_label = self._value_label(self, "0.0 PSI", 
+                                               font=('Arial', 10, 'bold'),
+                                               style='Value.TLabel')
+        self.pressure_label.grid(row=1, column=1, sticky='e', pady=(0, 2))
         
         # Temperature
-        temp_frame = ttk.Frame(self, style='Dashboard.TFrame')
-        temp_frame.pack(fill='x', pady=(0, 2))
-        
-        ttk.Label(temp_frame, text="Temp:", style='Unit.TLabel').pack(side='left')
-        self.temp_label = ttk.Label(temp_frame, text="0°C", 
-                                   font=('Arial', 10, 'bold'),
-                                   style='Value.TLabel')
-        self.temp_label.pack(side='right')
+        ttk.Label(self, text="Temp:", style='Unit.TLabel').grid(row=2, column=0, sticky='w', pady=(0, 2))
+        self.temp_label = self._value_label(self, "0°C", 
+                                           font=('Arial', 10, 'bold'),
+                                           style='Value.TLabel')
+        self.temp_label.grid(row=2, column=1, sticky='e', pady=(0, 2))
         
         # Wear bar
-        ttk.Label(self, text="Wear:", style='Unit.TLabel').pack(anchor='w')
-        self.wear_canvas = Canvas(self, width=80, height=10, 
-                                 bg='#2d2d2d', highlightthickness=0)
-        self.wear_canvas.pack(fill='x', pady=(0, 2))
+        ttk.Label(self, text="Wear:", style='Unit.TLabel').grid(row=3, column=0, columnspan=2, sticky='w')
+        self.wear_bar = ttk.Progressbar(self, orient='horizontal', length=80,
+                                        mode='determinate', maximum=100)
+        self.wear_bar.grid(row=4, column=0, columnspan=2, sticky='ew', pady=(0, 2))
         
         # Load indicator
-        ttk.Label(self, text="Load:", style='Unit.TLabel').pack(anchor='w')
+        ttk.Label(self, text="Load:", style='Unit.TLabel').grid(row=5, column=0, columnspan=2, sticky='w')
         self.load_canvas = Canvas(self, width=30, height=30, 
                                  bg='#2d2d2d', highlightthickness=0)
-        self.load_canvas.pack()
+        self.load_canvas.grid(row=6, column=0, columnspan=2)
+        c = self._LOAD_CENTER
+        self._load_circle_id = self.load_canvas.create_oval(c - 5, c - 5, c + 5, c + 5,
+                                                           fill='green', outline='')
+        self._load_cmd = self._canvas_command(self.load_canvas)
     
-    def update_data(self, pressure_bar: float, temperature_c: float, 
+    def update_data(self, pressure_psi_tenths: int, temperature_c: float, 
                    wear_percent: float, load_n: float):
-        """Update tire data display"""
-        # Convert pressure to PSI
-        pressure_psi = pressure_bar * 14.5038
+        """Update tire data display; pressure is given in whole tenths of a PSI"""
+        if self._defer(self.update_data, pressure_psi_tenths, temperature_c, wear_percent, load_n):
+            return
         
         # Update pressure with color coding
-        if self.pressure_label:
-            color = self.get_pressure_color(pressure_psi)
-            self.pressure_label.config(text=f"{pressure_psi:.1f} PSI", foreground=color)
+        if 0 <= pressure_psi_tenths < len(_PSI_STRS):
+            text = _PSI_STRS[pressure_psi_tenths]
+            style = _PSI_STYLES[pressure_psi_tenths]
+        elif pressure_psi_tenths < 0:
+            # No valid reading (the parser sends -1 for NaN/infinite pressure)
+            text = "-- PSI"
+            style = _VALUE_LABEL_STYLES['red']
+        else:
+            text = f"{pressure_psi_tenths / 10:.1f} PSI"
+            style = _VALUE_LABEL_STYLES[self.get_pressure_color(pressure_psi_tenths / 10)]
+        self._set_label(self.pressure_label, text, style)
         
         # Update temperature with color coding
-        if self.temp_label:
-            color = self.get_temperature_color(temperature_c)
-            self.temp_label.config(text=f"{temperature_c:.0f}°C", foreground=color)
+        style = _VALUE_LABEL_STYLES[self.get_temperature_color(temperature_c)]
+        self._set_label(self.temp_label, _degrees_text(round(temperature_c)) if math.isfinite(temperature_c) else f"{temperature_c:.0f}°C", style)
         
         # Update wear bar
         self.draw_wear_bar(wear_percent)
@@ -212,131 +394,150 @@ class TireWidget(BaseWidget):
         # Update load indicator
         self.draw_load_indicator(load_n)
     
-    def get_pressure_color(self, pressure_psi: float) -> str:
-        """Get color based on tire pressure"""
-        if 26.0 <= pressure_psi <= 29.0:  # Optimal range
-            return 'green'
-        elif 24.0 <= pressure_psi <= 31.0:  # Acceptable range
-            return 'yellow'
-        else:  # Too low or too high
-            return 'red'
-    
-    def get_temperature_color(self, temp_c: float) -> str:
-        """Get color based on tire temperature"""
-        if 80 <= temp_c <= 110:  # Optimal range
-            return 'green'
-        elif 70 <= temp_c <= 120:  # Acceptable range
-            return 'yellow'
-        else:  # Too cold or too hot
-            return 'red'
+    @staticmethod
+    def get_pressure_color(pressure_psi: float) -> str:
+        """Get color based on tire pressure (optimal 26-29 PSI, acceptable 24-31 PSI)"""
+        return _band_color(pressure_psi, _TIRE_PRESSURE_BANDS)
+    
+    @staticmethod
+    def get_temperature_color(temp_c: float) -> str:
+        """Get color based on tire temperature (optimal 80-110°C, acceptable 70-120°C)"""
+        return _band_color(temp_c, _TIRE_TEMP_BANDS)
     
     def draw_wear_bar(self, wear_percent: float):
         """Draw tire wear bar"""
-        if not self.wear_canvas:
-            return
-        
-        self.wear_canvas.delete("wear")
-        
-        # Background
-        self.wear_canvas.create_rectangle(0, 0, 80, 10, fill='#555555', outline='', tags="wear")
-        
         # Wear bar
-        wear_width = (wear_percent / 100) * 80
-        if wear_percent > 80:
-            color = 'green'
-        elif wear_percent > 50:
-            color = 'yellow'
-        else:
-            color = 'red'
+        color = _zone_color(wear_percent, 50, 80, _FALLING_COLORS)
         
-        self.wear_canvas.create_rectangle(0, 0, wear_width, 10, fill=color, outline='', tags="wear")
+        self.wear_bar['value'] = wear_percent
+        style = _WEAR_BAR_STYLES[color]
+        if style != self._wear_style:
+            self.wear_bar.configure(style=style)
+            self._wear_style = style
     
     def draw_load_indicator(self, load_n: float):
         """Draw wheel load indicator"""
-        if not self.load_canvas:
-            return
-        
-        self.load_canvas.delete("load")
-        
         # Normalize load (assuming max ~2000N for visualization)
         load_ratio = min(load_n / 2000, 1.0) if load_n > 0 else 0
         radius = 5 + (load_ratio * 10)  # 5-15 pixel radius
         
         # Color based on load
-        if load_ratio > 0.8:
-            color = 'red'
-        elif load_ratio > 0.6:
-            color = 'yellow'
-        else:
-            color = 'green'
+        color = _zone_color(load_ratio, 0.6, 0.8, _RISING_COLORS)
         
-        # Draw circle
-        center_x, center_y = 15, 15
-        self.load_canvas.create_oval(center_x - radius, center_y - radius,
-                                    center_x + radius, center_y + radius,
-                                    fill=color, outline='', tags="load")
+        # Resize circle
+        c = self._LOAD_CENTER
+        self._load_cmd('coords', self._load_circle_id, c - radius, c - radius, c + radius, c + radius)
+        self._load_cmd('itemconfigure', self._load_circle_id, '-fill', color)
+
+# Pressure label text and style for 0.0-49.9 PSI, indexed by tenths of a PSI
+_PSI_STRS = tuple(f"{i / 10:.1f} PSI" for i in range(500))
+_PSI_STYLES = tuple(_VALUE_LABEL_STYLES[TireWidget.get_pressure_color(i / 10)] for i in range(500))
+
+class TirePanel(ttk.LabelFrame):
+    """Panel holding the four TireWidgets, updated together from per-wheel arrays"""
+    
+    # (title, grid row, grid column) in FL, FR, RL, RR order
+    POSITIONS = (
+        ('Front Left', 0, 0), ('Front Right', 0, 1),
+        ('Rear Left', 1, 0), ('Rear Right', 1, 1)
+    )
+    
+    def __init__(self, parent):
+        super().__init__(parent, text='Tire Data', style='Dashboard.TFrame')
+        self.tires = tuple(TireWidget(self, name) for name, _, _ in self.POSITIONS)
+        for tire, (_, row, col) in zip(self.tires, self.POSITIONS):
+            tire.grid(row=row, column=col, padx=10, pady=5, sticky='nsew')
+        
+        # Configure grid weights
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+        
+        # Last (pressure, temp, wear, load) shown per wheel
+        self._last = [None] * len(self.tires)
+    
+    def update_all(self, pressures_psi_tenths, temps_c, wears_pct, loads_n):
+        """Update all four tires (FL, FR, RL, RR); wheels whose values did not change are skipped"""
+        last = self._last
+        for i, values in enumerate(zip(pressures_psi_tenths, temps_c, wears_pct, loads_n)):
+            if values != last[i]:
+                last[i] = values
+                self.tires[i].update_data(*values)
 
 class LapTimeWidget(BaseWidget):
     """Widget displaying lap times and delta"""
     
+    _grid_layout = True
+    
     def __init__(self, parent):
         super().__init__(parent, "LAP TIME")
         self.current_time_label = None
         self.last_lap_label = None
         self.best_lap_label = None
+        # Last/best only change once per lap; skip formatting them otherwise
+        self._last_lap = 0.0
+        self._best_lap = 0.0
         self.setup_lap_display()
     
     def setup_lap_display(self):
         """Setup lap time display"""
         # Current lap time
-        self.current_time_label = ttk.Label(self, text="00:00.000", 
-                                           font=('Arial', 14, 'bold'),
-                                           style='Value.TLabel')
-        self.current_time_label.pack()
+        self.current_time_label = self._value_label(self, "00:00.000", 
+                                                   font=('Arial', 14, 'bold'),
+                                                   style='Value.TLabel')
+        self.current_time_label.grid(row=1, column=0, columnspan=2)
         
         # Last lap
-        last_frame = ttk.Frame(self, style='Dashboard.TFrame')
-        last_frame.pack(fill='x')
-        
-        ttk.Label(last_frame, text="Last:", style='Unit.TLabel').pack(side='left')
-        self.last_lap_label = ttk.Label(last_frame, text="--:--:---", 
-                                       font=('Arial', 10),
-                                       style='Unit.TLabel')
-        self.last_lap_label.pack(side='right')
+        ttk.Label(self, text="Last:", style='Unit.TLabel').grid(row=2, column=0, sticky='w')
+        self.last_lap_label = self._value_label(self, "--:--:---", 
+                                               font=('Arial', 10),
+                                               style='Unit.TLabel')
+        self.last_lap_label.grid(row=2, column=1, sticky='e')
         
         # Best lap
-        best_frame = ttk.Frame(self, style='Dashboard.TFrame')
-        best_frame.pack(fill='x')
-        
-        ttk.Label(best_frame, text="Best:", style='Unit.TLabel').pack(side='left')
-        self.best_lap_label = ttk.Label(best_frame, text="--:--:---", 
-                                       font=('Arial', 10),
-                                       style='Unit.TLabel')
-        self.best_lap_label.pack(side='right')
+        ttk.Label(self, text="Best:", style='Unit.TLabel').grid(row=3, column=0, sticky='w')
+        self.best_lap_label = self._value_label(self, "--:--:---", 
+                                               font=('Arial', 10),
+                                               style='Unit.TLabel')
+        self.best_lap_label.grid(row=3, column=1, sticky='e')
     
     def update_times(self, current: float, last: float, best: float):
         """Update lap time display"""
-        if self.current_time_label:
-            self.current_time_label.config(text=self.format_time(current))
+        if self._defer(self.update_times, current, last, best):
+            return
+        
+        self._set_label(self.current_time_label, self.format_time(current))
         
-        if self.last_lap_label and last > 0:
-            self.last_lap_label.config(text=self.format_time(last))
+        if last > 0 and last != self._last_lap:
+            self._last_lap = last
+            self._set_label(self.last_lap_label, self.format_time(last))
         
-        if self.best_lap_label and best > 0:
-            self.best_lap_label.config(text=self.format_time(best))
+        if best > 0 and best != self._best_lap:
+            self._best_lap = best
+            self._set_label(self.best_lap_label, self.format_time(best))
     
     def format_time(self, seconds: float) -> str:
         """Format time in MM:SS.mmm format"""
         if seconds <= 0:
             return "00:00.000"
         
-        minutes = int(seconds // 60)
-        seconds = seconds % 60
-        return f"{minutes:02d}:{seconds:06.3f}"
+        # Work in whole milliseconds so rounding cannot produce "xx:60.000"
+        minutes, millis = divmod(int(seconds * 1000 + 0.5), 60000)
+        secs, millis = divmod(millis, 1000)
+        return f"{minutes:02d}:{secs:02d}.{millis:03d}"
 
 class GForceWidget(BaseWidget):
     """Widget displaying G-force with visual indicator"""
     
+    # Dot travel: 35 pixels from center at 2G
+    _RADIUS_PX = 35.0
+    _PX_PER_G = _RADIUS_PX / 2.0
+    
+    # Static geometry on the 100x100 canvas
+    _CENTER = 50
+    _CIRCLE_BBOX = (10, 10, 90, 90)
+    _VLINE = (50, 10, 50, 90)
+    _HLINE = (10, 50, 90, 50)
+    
     def __init__(self, parent):
         super().__init__(parent, "G-FORCE")
         self.gforce_canvas = None
@@ -351,6 +552,15 @@ class GForceWidget(BaseWidget):
                                    bg='#2d2d2d', highlightthickness=0)
         self.gforce_canvas.pack(pady=(0, 5))
         
+        # Static background circle and crosshairs; only the dot moves
+        c = self._CENTER
+        self.gforce_canvas.create_oval(*self._CIRCLE_BBOX, outline='#555555', width=2)
+        self.gforce_canvas.create_line(*self._VLINE, fill='#555555', width=1)
+        self.gforce_canvas.create_line(*self._HLINE, fill='#555555', width=1)
+        self._gforce_dot_id = self.gforce_canvas.create_oval(c - 3, c - 3, c + 3, c + 3,
+                                                            fill='green', outline='')
+        self._gforce_cmd = self._canvas_command(self.gforce_canvas)
+        
         # Value labels
         values_frame = ttk.Frame(self, style='Dashboard.TFrame')
         values_frame.pack()
@@ -360,9 +570,9 @@ class GForceWidget(BaseWidget):
         lat_frame.pack(side='left', padx=(0, 10))
         
         ttk.Label(lat_frame, text="Lateral:", style='Unit.TLabel').pack()
-        self.lateral_label = ttk.Label(lat_frame, text="0.00g", 
-                                      font=('Arial', 10, 'bold'),
-                                      style='Value.TLabel')
+        self.lateral_label = self._value_label(lat_frame, "0.00g", 
+                                              font=('Arial', 10, 'bold'),
+                                              style='Value.TLabel')
         self.lateral_label.pack()
         
         # Longitudinal G
@@ -370,62 +580,43 @@ class GForceWidget(BaseWidget):
         lon_frame.pack(side='right')
         
         ttk.Label(lon_frame, text="Longitudinal:", style='Unit.TLabel').pack()
-        self.longitudinal_label = ttk.Label(lon_frame, text="0.00g", 
-                                           font=('Arial', 10, 'bold'),
-                                           style='Value.TLabel')
+        self.longitudinal_label = self._value_label(lon_frame, "0.00g", 
+                                                   font=('Arial', 10, 'bold'),
+                                                   style='Value.TLabel')
         self.longitudinal_label.pack()
     
     def update_gforce(self, lateral: float, longitudinal: float):
         """Update G-force display"""
-        if self.lateral_label:
-            self.lateral_label.config(text=f"{lateral:.2f}g")
+        if self._defer(self.update_gforce, lateral, longitudinal):
+            return
         
-        if self.longitudinal_label:
-            self.longitudinal_label.config(text=f"{longitudinal:.2f}g")
+        self._set_label(self.lateral_label, _g_text(round(lateral * 100)) if math.isfinite(lateral) else f"{lateral:.2f}g")
+        
+        self._set_label(self.longitudinal_label, _g_text(round(longitudinal * 100)) if math.isfinite(longitudinal) else f"{longitudinal:.2f}g")
         
         # Update G-force circle
         self.draw_gforce_circle(lateral, longitudinal)
     
     def draw_gforce_circle(self, lateral: float, longitudinal: float):
         """Draw G-force visualization"""
-        if not self.gforce_canvas:
-            return
-        
-        self.gforce_canvas.delete("gforce")
-        
-        # Draw background circle
-        self.gforce_canvas.create_oval(10, 10, 90, 90, outline='#555555', width=2, tags="gforce")
-        
-        # Draw center crosshairs
-        self.gforce_canvas.create_line(50, 10, 50, 90, fill='#555555', width=1, tags="gforce")
-        self.gforce_canvas.create_line(10, 50, 90, 50, fill='#555555', width=1, tags="gforce")
-        
         # Calculate position (scale to fit circle, max 2G)
-        max_g = 2.0
-        x_offset = (lateral / max_g) * 35  # 35 pixels from center max
-        y_offset = -(longitudinal / max_g) * 35  # Negative for correct direction
+        total_g = math.hypot(lateral, longitudinal)
+        distance = total_g * self._PX_PER_G
         
         # Clamp to circle
-        distance = math.sqrt(x_offset**2 + y_offset**2)
-        if distance > 35:
-            x_offset = (x_offset / distance) * 35
-            y_offset = (y_offset / distance) * 35
+        scale = self._PX_PER_G if distance <= self._RADIUS_PX else self._RADIUS_PX / total_g
+        x_offset = lateral * scale
+        y_offset = -longitudinal * scale  # Negative for correct direction
         
-        # Draw G-force dot
-        dot_x = 50 + x_offset
-        dot_y = 50 + y_offset
+        # Move G-force dot
+        dot_x = self._CENTER + x_offset
+        dot_y = self._CENTER + y_offset
         
         # Color based on total G-force
-        total_g = math.sqrt(lateral**2 + longitudinal**2)
-        if total_g > 1.5:
-            color = 'red'
-        elif total_g > 1.0:
-            color = 'yellow'
-        else:
-            color = 'green'
+        color = _zone_color(total_g, 1.0, 1.5, _RISING_COLORS)
         
-        self.gforce_canvas.create_oval(dot_x - 3, dot_y - 3, dot_x + 3, dot_y + 3,
-                                      fill=color, outline='', tags="gforce")
+        self._gforce_cmd('coords', self._gforce_dot_id, dot_x - 3, dot_y - 3, dot_x + 3, dot_y + 3)
+        self._gforce_cmd('itemconfigure', self._gforce_dot_id, '-fill', color)
 
 class FuelWidget(BaseWidget):
     """Widget displaying fuel level"""
@@ -434,57 +625,52 @@ class FuelWidget(BaseWidget):
         super().__init__(parent, "FUEL")
         self.fuel_label = None
         self.fuel_bar = None
+        self._fuel_style = None
         self.setup_fuel_display()
     
     def setup_fuel_display(self):
         """Setup fuel display"""
         # Fuel value
-        self.fuel_label = ttk.Label(self, text="0.0 L", 
-                                   font=('Arial', 14, 'bold'),
-                                   style='Value.TLabel')
+        self.fuel_label = self._value_label(self, "0.0 L", 
+                                           font=('Arial', 14, 'bold'),
+                                           style='Value.TLabel')
         self.fuel_label.pack(pady=(0, 5))
         
         # Fuel bar
-        self.fuel_bar = Canvas(self, width=150, height=20, 
-                              bg='#2d2d2d', highlightthickness=0)
+        self.fuel_bar = ttk.Progressbar(self, orient='horizontal', length=150,
+                                        mode='determinate', maximum=1.0)
         self.fuel_bar.pack()
     
     def update_fuel(self, fuel_liters: float):
         """Update fuel display"""
-        if self.fuel_label:
-            color = 'red' if fuel_liters < 5 else '#ffffff'
-            self.fuel_label.config(text=f"{fuel_liters:.1f} L", foreground=color)
+        if self._defer(self.update_fuel, fuel_liters):
+            return
+        
+        style = 'Red.Value.TLabel' if fuel_liters < 5 else 'Value.TLabel'
+        self._set_label(self.fuel_label, _liters_text(round(fuel_liters * 10)) if math.isfinite(fuel_liters) else f"{fuel_liters:.1f} L", style)
         
         # Update fuel bar (assuming max 100L for visualization)
         self.draw_fuel_bar(fuel_liters)
     
     def draw_fuel_bar(self, fuel_liters: float):
         """Draw fuel level bar"""
-        if not self.fuel_bar:
-            return
-        
-        self.fuel_bar.delete("fuel")
-        
-        # Background
-        self.fuel_bar.create_rectangle(0, 0, 150, 20, fill='#555555', outline='', tags="fuel")
-        
         # Fuel bar (assuming max 100L)
         fuel_ratio = min(fuel_liters / 100, 1.0) if fuel_liters > 0 else 0
-        fuel_width = fuel_ratio * 150
         
-        # Color based on fuel level
-        if fuel_ratio < 0.1:  # Less than 10%
-            color = 'red'
-        elif fuel_ratio < 0.25:  # Less than 25%
-            color = 'yellow'
-        else:
-            color = 'green'
+        # Color based on fuel level: red below 10%, yellow below 25%
+        color = _zone_color_from(fuel_ratio, 0.1, 0.25, _FALLING_COLORS)
         
-        self.fuel_bar.create_rectangle(0, 0, fuel_width, 20, fill=color, outline='', tags="fuel")
+        self.fuel_bar['value'] = fuel_ratio
+        style = _FUEL_BAR_STYLES[color]
+        if style != self._fuel_style:
+            self.fuel_bar.configure(style=style)
+            self._fuel_style = style
 
 class TemperatureWidget(BaseWidget):
     """Widget displaying engine temperatures"""
     
+    _grid_layout = True
+    
     def __init__(self, parent):
         super().__init__(parent, "TEMPERATURES")
         self.water_temp_label = None
@@ -494,53 +680,40 @@ class TemperatureWidget(BaseWidget):
     def setup_temperature_display(self):
         """Setup temperature display"""
         # Water temperature
-        water_frame = ttk.Frame(self, style='Dashboard.TFrame')
-        water_frame.pack(fill='x', pady=(0, 5))
-        
-        ttk.Label(water_frame, text="Water:", style='Unit.TLabel').pack(side='left')
-        self.water_temp_label = ttk.Label(water_frame, text="0°C", 
-                                         font=('Arial', 12, 'bold'),
-                                         style='Value.TLabel')
-        self.water_temp_label.pack(side='right')
+        ttk.Label(self, text="Water:", style='Unit.TLabel').grid(row=1, column=0, sticky='w', pady=(0, 5))
+        self.water_temp_label = self._value_label(self, "0°C", 
+                                                 font=('Arial', 12, 'bold'),
+                                                 style='Value.TLabel')
+        self.water_temp_label.grid(row=1, column=1, sticky='e', pady=(0, 5))
         
         # Oil temperature
-        oil_frame = ttk.Frame(self, style='Dashboard.TFrame')
-        oil_frame.pack(fill='x')
-        
-        ttk.Label(oil_frame, text="Oil:", style='Unit.TLabel').pack(side='left')
-        self.oil_temp_label = ttk.Label(oil_frame, text="0°C", 
-                                       font=('Arial', 12, 'bold'),
-                                       style='Value.TLabel')
-        self.oil_temp_label.pack(side='right')
+        ttk.Label(self, text="Oil:", style='Unit.TLabel').grid(row=2, column=0, sticky='w')
+        self.oil_temp_label = self._value_label(self, "0°C", 
+                                               font=('Arial', 12, 'bold'),
+                                               style='Value.TLabel')
+        self.oil_temp_label.grid(row=2, column=1, sticky='e')
     
     def update_temperatures(self, water_temp: float, oil_temp: float):
         """Update temperature display"""
-        if self.water_temp_label:
-            color = self.get_water_temp_color(water_temp)
-            self.water_temp_label.config(text=f"{water_temp:.0f}°C", foreground=color)
+        if self._defer(self.update_temperatures, water_temp, oil_temp):
+            return
+        
+        style = _VALUE_LABEL_STYLES[self.get_water_temp_color(water_temp)]
+        self._set_label(self.water_temp_label, _degrees_text(round(water_temp)) if math.isfinite(water_temp) else f"{water_temp:.0f}°C", style)
         
-        if self.oil_temp_label:
-            color = self.get_oil_temp_color(oil_temp)
-            self.oil_temp_label.config(text=f"{oil_temp:.0f}°C", foreground=color)
+        style = _VALUE_LABEL_STYLES[self.get_oil_temp_color(oil_temp)]
+        self._set_label(self.oil_temp_label, _degrees_text(round(oil_temp)) if math.isfinite(oil_temp) else f"{oil_temp:.0f}°C", style)
     
-    def get_water_temp_color(self, temp: float) -> str:
+    @staticmethod
+    def get_water_temp_color(temp: float) -> str:
         """Get color based on water temperature"""
-        if temp > 105:  # Too hot
-            return 'red'
-        elif temp > 95:  # Getting hot
-            return 'yellow'
-        elif temp < 80:  # Too cold
+        if temp < _WATER_TEMP_COLD:
             return 'lightblue'
-        else:  # Optimal
-            return 'green'
+        return _HOT_COLORS[bisect_left(_WATER_TEMP_HOT, temp)]
     
-    def get_oil_temp_color(self, temp: float) -> str:
+    @staticmethod
+    def get_oil_temp_color(temp: float) -> str:
         """Get color based on oil temperature"""
-        if temp > 120:  # Too hot
-            return 'red'
-        elif temp > 110:  # Getting hot
-            return 'yellow'
-        elif temp < 90:  # Too cold
+        if temp < _OIL_TEMP_COLD:
             return 'lightblue'
-        else:  # Optimal
-            return 'green'
\ No newline at end of file
+        return _HOT_COLORS[bisect_left(_OIL_TEMP_HOT, temp)]
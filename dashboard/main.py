@@ -7,13 +7,14 @@ Main application entry point with UDP telemetry and GUI
 import sys
 import os
 import json
+import select
 import socket
 import struct
 import threading
 import time
 import csv
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union
 import tkinter as tk
 from tkinter import ttk, messagebox
 import configparser
@@ -21,42 +22,73 @@ import configparser
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from dashboard.telemetry_parser import TelemetryParser
+from dashboard.telemetry_parser import TelemetryParser, TelemetrySnapshot
 from dashboard.gui.main_window import MainWindow
 from dashboard.gui.widgets import TelemetryWidget
 from dashboard.controls.vehicle_controls import VehicleControls
 from dashboard.utils.config_manager import ConfigManager
 from dashboard.utils.logger import Logger
 
+# Kernel receive buffer for the telemetry socket, large enough to absorb bursts
+UDP_RCVBUF_BYTES = 2 * 1024 * 1024
+
+# How long the receive loop waits for packets before re-checking for shutdown
+SELECT_TIMEOUT = 0.1
+
+# Seconds without packets before the telemetry connection is considered lost
+CONNECTION_TIMEOUT = 1.0
+
+# GUI polling interval (ms): 20Hz while telemetry changes, slower while idle
+GUI_UPDATE_INTERVAL_MS = 50
+GUI_IDLE_INTERVAL_MS = 250
+
 class ACTelemetryDashboard:
     """Main dashboard application class"""
     
     def __init__(self):
-        self.logger = Logger("ACDashboard")
+        # Configuration
         self.config_manager = ConfigManager()
+        self.config = self.config_manager.load_config()
+        
+        log_config = self.config.get('logging', {})
+        self.logger = Logger("ACDashboard",
+                             max_file_size=log_config.get('max_file_size', 100),
+                             max_files=log_config.get('max_files', 10))
         self.telemetry_parser = TelemetryParser()
         self.vehicle_controls = VehicleControls()
         
         # UDP connection
         self.udp_socket = None
         self.udp_thread = None
+        self._rx_buf = None  # receive buffer reused for every packet
+        self._rx_view = None
         self.running = False
         self.connected = False
         
-        # Telemetry data
-        self.current_data = {}
-        self.last_update = None
+        # Telemetry data: the UDP thread replaces the latest update packet
+        # wholesale and the GUI reads it once per tick
+        self._latest = None
+        self.session_info = {}  # car/driver names from handshake packets
+        
+        # Packet and connection state last handed to the GUI
+        self._shown_data = None
+        self._shown_connected = None
+        self.last_update = None  # time.monotonic() of the last parsed packet
         
         # Logging
         self.log_file = None
         self.csv_writer = None
+        self._log_fields = ()  # CSV column order
 
         # GUI
         self.root = None
         self.main_window = None
         
-        # Configuration
-        self.config = self.config_manager.load_config()
+        # CSV rows are flushed to disk in batches rather than one by one
+        self._rows_since_flush = 0
+        
+        # Logging settings used on the per-packet path
+        self.apply_logging_config()
         
     def initialize(self):
         """Initialize the dashboard application"""
@@ -67,6 +99,7 @@ class ACTelemetryDashboard:
             self.root = tk.Tk()
             self.root.title("AC Telemetry Dashboard")
             self.root.geometry(self.config.get('window', {}).get('geometry', '1200x800'))
+            self.root.report_callback_exception = self.report_callback_exception
             
             # Set icon if available
             try:
@@ -83,7 +116,7 @@ class ACTelemetryDashboard:
             self.setup_udp_connection()
             
             # Setup periodic updates
-            self.root.after(50, self.update_gui)  # 20Hz GUI updates
+            self.root.after(GUI_UPDATE_INTERVAL_MS, self.update_gui)
             
             self.logger.info("Dashboard initialized successfully")
             return True
@@ -92,6 +125,18 @@ class ACTelemetryDashboard:
             self.logger.error(f"Failed to initialize dashboard: {e}")
             return False
     
+    def apply_logging_config(self):
+        """Resolve logging settings from the config once; call again after the config changes"""
+        log_config = self.config.get('logging', {})
+        self._logging_enabled = bool(log_config.get('enabled', False))
+        self._log_dir = log_config.get('directory', 'logs')
+        self._log_columns = log_config.get('columns')
+        self._flush_every = max(1, int(log_config.get('flush_every', 100)))
+    
+    def report_callback_exception(self, exc_type, exc_value, exc_tb):
+        """Log errors raised from Tk callbacks instead of printing them to stderr"""
+        self.logger.exception(f"Unhandled error in GUI callback: {exc_value}")
+    
     def setup_udp_connection(self):
         """Setup UDP socket for telemetry data"""
         try:
@@ -99,9 +144,13 @@ class ACTelemetryDashboard:
             host = udp_config.get('host', 'localhost')
             port = udp_config.get('port', 9996)
             
+            self._rx_buf = bytearray(udp_config.get('buffer_size', 4096))
+            self._rx_view = memoryview(self._rx_buf)
+            
             self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RCVBUF_BYTES)
             self.udp_socket.bind((host, port))
-            self.udp_socket.settimeout(1.0)  # 1 second timeout
+            self.udp_socket.setblocking(False)  # drained by telemetry_loop after select
             
             self.logger.info(f"UDP socket bound to {host}:{port}")
             
@@ -126,37 +175,48 @@ class ACTelemetryDashboard:
     
     def telemetry_loop(self):
         """Main telemetry receiving loop"""
+        last_packet = time.monotonic()
         while self.running:
             try:
                 if self.udp_socket:
-                    data, addr = self.udp_socket.recvfrom(4096)
-                    self.process_telemetry_data(data)
+                    readable, _, _ = select.select([self.udp_socket], [], [], SELECT_TIMEOUT)
+                    if not readable:
+                        if self.connected and time.monotonic() - last_packet > CONNECTION_TIMEOUT:
+                            self.connected = False
+                            self.logger.warning("Telemetry connection timeout")
+                        continue
                     
-                    if not self.connected:
-                        self.connected = True
-                        self.logger.info(f"Connected to AC telemetry from {addr}")
+                    # Drain every packet already queued before waiting again
+                    while True:
+                        try:
+                            nbytes, addr = self.udp_socket.recvfrom_into(self._rx_buf)
+                        except BlockingIOError:
+                            break
+                        self.process_telemetry_data(self._rx_view[:nbytes])
+                        last_packet = time.monotonic()
+                        
+                        if not self.connected:
+                            self.connected = True
+                            self.logger.info(f"Connected to AC telemetry from {addr}")
                         
-            except socket.timeout:
-                if self.connected:
-                    self.connected = False
-                    self.logger.warning("Telemetry connection timeout")
-                continue
-                
             except Exception as e:
                 if self.running:  # Only log if we're supposed to be running
                     self.logger.error(f"Telemetry loop error: {e}")
                 time.sleep(0.1)
     
-    def process_telemetry_data(self, data: bytes):
+    def process_telemetry_data(self, data: Union[bytes, memoryview]):
         """Process incoming telemetry data"""
         try:
             parsed_data = self.telemetry_parser.parse(data)
             if parsed_data:
-                self.current_data.update(parsed_data)
-                self.last_update = datetime.now()
+                if parsed_data.get('packet_type') == 'update':
+                    self._latest = parsed_data
+                else:
+                    self.session_info.update(parsed_data)
+                self.last_update = time.monotonic()
                 
                 # Log telemetry data if enabled
-                if self.config.get('logging', {}).get('enabled', False):
+                if self._logging_enabled:
                     self.log_telemetry_data(parsed_data)
                     
         except Exception as e:
@@ -165,46 +225,59 @@ class ACTelemetryDashboard:
     def log_telemetry_data(self, data: Dict[str, Any]):
         """Log telemetry data to file"""
         try:
-            log_config = self.config.get('logging', {})
-            if not log_config.get('enabled', False):
+            if not self._logging_enabled:
                 return
-
+            
             # Initialize CSV writer on first call
-            if self.csv_writer is None:
-                log_dir = log_config.get('directory', 'logs')
-                os.makedirs(log_dir, exist_ok=True)
-                
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                log_path = os.path.join(log_dir, f'telemetry_{timestamp}.csv')
-
-                self.log_file = open(log_path, 'w', newline='', encoding='utf-8')
-
-                # Get headers from config or use all keys
-                log_columns = log_config.get('columns', list(data.keys()))
-
-                self.csv_writer = csv.DictWriter(self.log_file, fieldnames=log_columns)
-                self.csv_writer.writeheader()
+            writer = self.csv_writer
+            if writer is None:
+                writer = self._open_log_file(data)
             
-            # Filter data to only include specified columns
-            log_data = {k: data.get(k) for k in self.csv_writer.fieldnames}
-
-            # Write data to CSV
-            if self.csv_writer:
-                self.csv_writer.writerow(log_data)
+            # Write data to CSV, values in column order
+            get = data.get
+            writer.writerow([get(k) for k in self._log_fields])
+            rows = self._rows_since_flush + 1
+            if rows >= self._flush_every:
                 self.log_file.flush()
-
+                rows = 0
+            self._rows_since_flush = rows
+            
         except Exception as e:
             self.logger.error(f"Failed to log telemetry data: {e}")
     
+    def _open_log_file(self, data: Dict[str, Any]):
+        """Create the CSV log file and write its header; returns the CSV writer"""
+        log_dir = self._log_dir
+        os.makedirs(log_dir, exist_ok=True)
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        log_path = os.path.join(log_dir, f'telemetry_{timestamp}.csv')
+        
+        self.log_file = open(log_path, 'w', newline='', encoding='utf-8', buffering=65536)
+        
+        # Get headers from config or use all keys
+        self._log_fields = tuple(self._log_columns or data.keys())
+        
+        self.csv_writer = csv.writer(self.log_file)
+        self.csv_writer.writerow(self._log_fields)
+        return self.csv_writer
+    
     def update_gui(self):
-        """Update GUI with latest telemetry data"""
+        """Update GUI with latest telemetry data; polls slower while nothing changes"""
         try:
-            if self.main_window:
-                self.main_window.update_telemetry(self.current_data, self.connected)
+            data = self._latest
+            connected = self.connected
+            changed = data is not self._shown_data or connected != self._shown_connected
+            if self.main_window and changed:
+                snapshot = TelemetrySnapshot.from_data(data) if data else None
+                self.main_window.update_telemetry(snapshot, connected)
+                self._shown_data = data
+                self._shown_connected = connected
             
             # Schedule next update
             if self.root:
-                self.root.after(50, self.update_gui)
+                interval = GUI_UPDATE_INTERVAL_MS if changed else GUI_IDLE_INTERVAL_MS
+                self.root.after(interval, self.update_gui)
                 
         except Exception as e:
             self.logger.error(f"GUI update error: {e}")
@@ -218,6 +291,15 @@ class ACTelemetryDashboard:
         except Exception as e:
             self.logger.error(f"Failed to send control command {command}: {e}")
     
+    def send_control_commands(self, commands):
+        """Send several control commands to AC in a single packet"""
+        try:
+            self.vehicle_controls.send_commands(commands)
+            self.logger.debug(f"Sent control commands: {commands}")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to send control commands: {e}")
+    
     def run(self):
         """Start the dashboard application"""
         if not self.initialize():
@@ -270,7 +352,7 @@ class ACTelemetryDashboard:
             if self.udp_socket:
                 self.udp_socket.close()
 
-            # Close log file
+            # Close log file (flushes any rows still buffered)
             if self.log_file:
                 self.log_file.close()
                 
@@ -3,11 +3,19 @@ Assetto Corsa UDP Telemetry Parser
 Handles parsing of AC's telemetry data packets
 """
 
+import logging
+import math
 import struct
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import time
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple, Union
+from dataclasses import dataclass, field
 from enum import IntEnum
 
+logger = logging.getLogger("ACDashboard.telemetry")
+
+# Parse errors are logged at most once per interval (seconds); a bad stream can fail every packet
+PARSE_ERROR_LOG_INTERVAL = 5.0
+
 class ACUDPType(IntEnum):
     """AC UDP packet types"""
     HANDSHAKER = 0
@@ -15,6 +23,12 @@ class ACUDPType(IntEnum):
     SPOT = 2
     DISMISS = 3
 
+def _zeros3() -> List[float]:
+    return [0.0] * 3
+
+def _zeros4() -> List[float]:
+    return [0.0] * 4
+
 @dataclass
 class TelemetryData:
     """Container for parsed telemetry data"""
@@ -31,24 +45,24 @@ class TelemetryData:
     
     # Brake system
     brake_bias: float = 0.5  # 0.0 = rear, 1.0 = front
-    brake_pressure: List[float] = None  # [FL, FR, RL, RR]
+    brake_pressure: List[float] = field(default_factory=_zeros4)  # [FL, FR, RL, RR]
     
     # Tire data (FL, FR, RL, RR)
-    tire_pressure: List[float] = None
-    tire_temperature_core: List[float] = None
-    tire_temperature_inner: List[float] = None
-    tire_temperature_middle: List[float] = None
-    tire_temperature_outer: List[float] = None
-    tire_wear: List[float] = None
+    tire_pressure: List[float] = field(default_factory=_zeros4)
+    tire_temperature_core: List[float] = field(default_factory=_zeros4)
+    tire_temperature_inner: List[float] = field(default_factory=_zeros4)
+    tire_temperature_middle: List[float] = field(default_factory=_zeros4)
+    tire_temperature_outer: List[float] = field(default_factory=_zeros4)
+    tire_wear: List[float] = field(default_factory=_zeros4)
     
     # Suspension
-    suspension_travel: List[float] = None
-    suspension_velocity: List[float] = None
+    suspension_travel: List[float] = field(default_factory=_zeros4)
+    suspension_velocity: List[float] = field(default_factory=_zeros4)
     
     # Wheel data
-    wheel_load: List[float] = None
-    wheel_angular_speed: List[float] = None
-    wheel_slip: List[float] = None
+    wheel_load: List[float] = field(default_factory=_zeros4)
+    wheel_angular_speed: List[float] = field(default_factory=_zeros4)
+    wheel_slip: List[float] = field(default_factory=_zeros4)
     
     # Vehicle dynamics
     g_force_lateral: float = 0.0
@@ -56,9 +70,9 @@ class TelemetryData:
     g_force_vertical: float = 0.0
     
     # Position and orientation
-    car_position: List[float] = None  # [x, y, z]
-    car_velocity: List[float] = None  # [x, y, z]
-    car_acceleration: List[float] = None  # [x, y, z]
+    car_position: List[float] = field(default_factory=_zeros3)  # [x, y, z]
+    car_velocity: List[float] = field(default_factory=_zeros3)  # [x, y, z]
+    car_acceleration: List[float] = field(default_factory=_zeros3)  # [x, y, z]
     
     # Lap data
     lap_time: float = 0.0
@@ -82,39 +96,62 @@ class TelemetryData:
     pit_limiter_on: bool = False
     in_pit: bool = False
     engine_map: int = 0
+
+# Tire pressure conversion factor
+BAR_TO_PSI = 14.5038
+
+# tire_pressure_psi_tenths value for a wheel whose pressure is NaN or infinite
+PSI_TENTHS_INVALID = -1
+
+# Optimal tire pressure (27.5 PSI average) in bar
+_OPTIMAL_PRESSURE_BAR = 1.896
+
+# Shared immutable defaults for per-wheel values (FL, FR, RL, RR)
+_ZEROS4 = (0.0, 0.0, 0.0, 0.0)
+_WEAR_DEFAULT = (100.0, 100.0, 100.0, 100.0)
+
+class TelemetrySnapshot(NamedTuple):
+    """Immutable per-frame view of the telemetry fields shown by the GUI"""
+    speed_kmh: float = 0.0
+    speed_mph: float = 0.0
+    rpm: int = 0
+    max_rpm: int = 8000
+    gear: int = 0
+    gear_recommendation: str = 'OPTIMAL'
+    lap_time: float = 0.0
+    last_lap: float = 0.0
+    best_lap: float = 0.0
+    # Per-wheel values (FL, FR, RL, RR)
+    tire_pressure_psi_tenths: Tuple[int, ...] = (0, 0, 0, 0)
+    tire_temperature_core: Tuple[float, ...] = _ZEROS4
+    tire_wear: Tuple[float, ...] = _WEAR_DEFAULT  # 100% if not available
+    wheel_load: Tuple[float, ...] = _ZEROS4
+    g_force_lateral: float = 0.0
+    g_force_longitudinal: float = 0.0
+    fuel: float = 0.0
+    water_temp: float = 0.0
+    oil_temp: float = 0.0
     
-    def __post_init__(self):
-        """Initialize list fields if None"""
-        if self.brake_pressure is None:
-            self.brake_pressure = [0.0] * 4
-        if self.tire_pressure is None:
-            self.tire_pressure = [0.0] * 4
-        if self.tire_temperature_core is None:
-            self.tire_temperature_core = [0.0] * 4
-        if self.tire_temperature_inner is None:
-            self.tire_temperature_inner = [0.0] * 4
-        if self.tire_temperature_middle is None:
-            self.tire_temperature_middle = [0.0] * 4
-        if self.tire_temperature_outer is None:
-            self.tire_temperature_outer = [0.0] * 4
-        if self.tire_wear is None:
-            self.tire_wear = [0.0] * 4
-        if self.suspension_travel is None:
-            self.suspension_travel = [0.0] * 4
-        if self.suspension_velocity is None:
-            self.suspension_velocity = [0.0] * 4
-        if self.wheel_load is None:
-            self.wheel_load = [0.0] * 4
-        if self.wheel_angular_speed is None:
-            self.wheel_angular_speed = [0.0] * 4
-        if self.wheel_slip is None:
-            self.wheel_slip = [0.0] * 4
-        if self.car_position is None:
-            self.car_position = [0.0] * 3
-        if self.car_velocity is None:
-            self.car_velocity = [0.0] * 3
-        if self.car_acceleration is None:
-            self.car_acceleration = [0.0] * 3
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'TelemetrySnapshot':
+        """Build a snapshot from merged telemetry data, filling in defaults"""
+        defaults = cls._field_defaults
+        return cls._make([data.get(name, defaults[name]) for name in cls._fields])
+
+# Fixed layout of the update packet body (after the 4-byte packet type):
+# speed, 8 unused bytes, rpm, max rpm, gear, G-forces (x, y, z),
+# lap times in ms (current, last, best), lap count, fuel, position (skipped),
+# velocity (x, y, z), acceleration (x, y, z), then six per-wheel groups:
+# angular speed, slip, load, tire pressure, tire core temperature and
+# suspension travel. Tire temperature inner/middle/outer are not parsed yet.
+_UPDATE_STRUCT = struct.Struct('<f8x2fi3f4if12x3f3f4f4f4f4f4f4f')
+
+# Minimum expected size of an update packet body for AC telemetry (covers _UPDATE_STRUCT)
+UPDATE_PACKET_MIN_SIZE = 328
+
+# Packet header: the packet type as a little-endian uint32
+_HEADER_STRUCT = struct.Struct('<I')
+_UPDATE_TYPE = int(ACUDPType.UPDATE)
 
 class TelemetryParser:
     """Parser for Assetto Corsa UDP telemetry data"""
@@ -122,13 +159,19 @@ class TelemetryParser:
     def __init__(self):
         self.last_data = TelemetryData()
         self.packet_count = 0
+        # (payload, result) of the last handshake; repeats return the same result
+        self._handshake_cache = (None, None)
+        # Parse error throttling
+        self._last_error_log = float('-inf')
+        self._suppressed_errors = 0
         
-    def parse(self, data: bytes) -> Optional[Dict[str, Any]]:
+    def parse(self, data: Union[bytes, memoryview]) -> Optional[Dict[str, Any]]:
         """
         Parse UDP telemetry packet from Assetto Corsa
         
         Args:
-            data: Raw UDP packet data
+            data: Raw UDP packet data; a memoryview over a receive buffer is
+                parsed without copying and is not referenced afterwards
             
         Returns:
             Dictionary of parsed telemetry data or None if parsing failed
@@ -138,188 +181,155 @@ class TelemetryParser:
                 return None
                 
             # Read packet type
-            packet_type = struct.unpack('<I', data[:4])[0]
+            packet_type = _HEADER_STRUCT.unpack_from(data)[0]
             
-            if packet_type == ACUDPType.HANDSHAKER:
-                return self._parse_handshaker(data[4:])
-            elif packet_type == ACUDPType.UPDATE:
+            # Nearly all traffic is update packets, so test for them first
+            if packet_type == _UPDATE_TYPE:
                 return self._parse_update(data[4:])
+            elif packet_type == ACUDPType.HANDSHAKER:
+                return self._parse_handshaker(data[4:])
             elif packet_type == ACUDPType.SPOT:
                 return self._parse_spot(data[4:])
             else:
                 return None
                 
         except Exception as e:
-            print(f"Telemetry parsing error: {e}")
+            self._log_parse_error(e)
             return None
     
-    def _parse_handshaker(self, data: bytes) -> Dict[str, Any]:
+    def _log_parse_error(self, error: Exception):
+        """Log a parse failure, at most once per PARSE_ERROR_LOG_INTERVAL; failures in between are counted"""
+        now = time.monotonic()
+        if now - self._last_error_log < PARSE_ERROR_LOG_INTERVAL:
+            self._suppressed_errors += 1
+            return
+        if self._suppressed_errors:
+            logger.warning("Telemetry parsing error: %s (%d more since last report)", error, self._suppressed_errors)
+        else:
+            logger.warning("Telemetry parsing error: %s", error)
+        self._last_error_log = now
+        self._suppressed_errors = 0
+    
+    def _parse_handshaker(self, data: Union[bytes, memoryview]) -> Dict[str, Any]:
         """Parse handshaker packet"""
         try:
             if len(data) < 8:
                 return {}
                 
-            car_name_len, driver_name_len = struct.unpack('<II', data[:8])
+            payload = bytes(data)
+            cached_payload, cached_result = self._handshake_cache
+            if payload == cached_payload:
+                return cached_result
+            
+            car_name_len, driver_name_len = struct.unpack_from('<II', payload)
             offset = 8
             
-            car_name = data[offset:offset + car_name_len].decode('utf-8', errors='ignore').rstrip('\x00')
+            car_name = payload[offset:offset + car_name_len].decode('utf-8', errors='ignore').rstrip('\x00')
             offset += car_name_len
             
-            driver_name = data[offset:offset + driver_name_len].decode('utf-8', errors='ignore').rstrip('\x00')
+            driver_name = payload[offset:offset + driver_name_len].decode('utf-8', errors='ignore').rstrip('\x00')
             
-            return {
+            result = {
                 'car_name': car_name,
                 'driver_name': driver_name,
                 'packet_type': 'handshaker'
             }
+            self._handshake_cache = (payload, result)
+            return result
             
         except Exception:
             return {}
     
-    def _parse_update(self, data: bytes) -> Dict[str, Any]:
-        """Parse main telemetry update packet"""
-        try:
-            if len(data) < 328:  # Minimum expected size for AC telemetry
-                return {}
-            
-            # Parse main telemetry data using struct
-            # This is based on AC's telemetry structure
-            offset = 0
-            
-            # Basic car data
-            speed_kmh = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            
-            # Skip some bytes and get RPM
-            offset += 8  # Skip to RPM
-            rpm = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            
-            max_rpm = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            
-            # Gear
-            gear = struct.unpack('<i', data[offset:offset+4])[0]
-            offset += 4
-            
-            # G-forces
-            g_force_x = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            g_force_y = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            g_force_z = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            
-            # Lap time
-            lap_time = struct.unpack('<i', data[offset:offset+4])[0] / 1000.0  # Convert ms to seconds
-            offset += 4
-            
-            last_lap = struct.unpack('<i', data[offset:offset+4])[0] / 1000.0
-            offset += 4
-            
-            best_lap = struct.unpack('<i', data[offset:offset+4])[0] / 1000.0
-            offset += 4
-            
-            lap_count = struct.unpack('<i', data[offset:offset+4])[0]
-            offset += 4
-            
-            # Fuel
-            fuel = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            
-            # Position (skip for now)
-            offset += 12  # 3 floats for position
-            
-            # Velocity
-            velocity_x = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            velocity_y = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            velocity_z = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            
-            # Acceleration
-            accel_x = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            accel_y = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            accel_z = struct.unpack('<f', data[offset:offset+4])[0]
-            offset += 4
-            
-            # Wheel data (4 wheels)
-            wheel_angular_speed = []
-            for i in range(4):
-                wheel_angular_speed.append(struct.unpack('<f', data[offset:offset+4])[0])
-                offset += 4
-            
-            wheel_slip = []
-            for i in range(4):
-                wheel_slip.append(struct.unpack('<f', data[offset:offset+4])[0])
-                offset += 4
-            
-            wheel_load = []
-            for i in range(4):
-                wheel_load.append(struct.unpack('<f', data[offset:offset+4])[0])
-                offset += 4
-            
-            # Tire pressure
-            tire_pressure = []
-            for i in range(4):
-                tire_pressure.append(struct.unpack('<f', data[offset:offset+4])[0])
-                offset += 4
-            
-            # Tire temperature (core)
-            tire_temp_core = []
-            for i in range(4):
-                tire_temp_core.append(struct.unpack('<f', data[offset:offset+4])[0])
-                offset += 4
-            
-            # Skip tire temperature inner/middle/outer for now (would need more offset calculations)
-            
-            # Suspension travel
-            suspension_travel = []
-            for i in range(4):
-                suspension_travel.append(struct.unpack('<f', data[offset:offset+4])[0])
-                offset += 4
-            
-            # Calculate speed in mph
-            speed_mph = speed_kmh * 0.621371
-            
-            # Build result dictionary
-            result = {
-                'speed_kmh': speed_kmh,
-                'speed_mph': speed_mph,
-                'rpm': int(rpm),
-                'max_rpm': int(max_rpm),
-                'gear': gear,
-                'g_force_lateral': g_force_x,
-                'g_force_longitudinal': g_force_y,
-                'g_force_vertical': g_force_z,
-                'lap_time': lap_time,
-                'last_lap': last_lap,
-                'best_lap': best_lap,
-                'lap_count': lap_count,
-                'fuel': fuel,
-                'car_velocity': [velocity_x, velocity_y, velocity_z],
-                'car_acceleration': [accel_x, accel_y, accel_z],
-                'wheel_angular_speed': wheel_angular_speed,
-                'wheel_slip': wheel_slip,
-                'wheel_load': wheel_load,
-                'tire_pressure': tire_pressure,
-                'tire_temperature_core': tire_temp_core,
-                'suspension_travel': suspension_travel,
-                'packet_type': 'update'
-            }
-            
-            # Calculate derived values
-            result.update(self._calculate_derived_values(result))
-            
-            self.packet_count += 1
-            return result
-            
-        except Exception as e:
-            print(f"Update packet parsing error: {e}")
+    def _parse_update(self, data: Union[bytes, memoryview]) -> Dict[str, Any]:
+        """Parse main telemetry update packet.
+        
+        The length check guarantees the fixed layout can be unpacked, so there
+        is no exception handler here; anything unexpected propagates to parse().
+        """
+        if len(data) < UPDATE_PACKET_MIN_SIZE:
             return {}
+        
+        # Parse the fixed part of the packet in one call
+        values = _UPDATE_STRUCT.unpack_from(data, 0)
+        (speed_kmh, rpm, max_rpm, gear,
+         g_force_x, g_force_y, g_force_z,
+         lap_time_ms, last_lap_ms, best_lap_ms, lap_count,
+         fuel) = values[:12]
+        rest = values[12:]
+        
+        # Lap times are sent in milliseconds
+        lap_time = lap_time_ms / 1000.0
+        last_lap = last_lap_ms / 1000.0
+        best_lap = best_lap_ms / 1000.0
+        
+        # Velocity and acceleration (x, y, z)
+        velocity_x, velocity_y, velocity_z = rest[0:3]
+        accel_x, accel_y, accel_z = rest[3:6]
+        
+        # Per-wheel data (FL, FR, RL, RR)
+        wheel_angular_speed = rest[6:10]
+        wheel_slip = rest[10:14]
+        wheel_load = rest[14:18]
+        tire_pressure = rest[18:22]
+        tire_temp_core = rest[22:26]
+        suspension_travel = rest[26:30]
+        
+        # Calculate speed in mph
+        speed_mph = speed_kmh * 0.621371
+        rpm = int(rpm)
+        max_rpm = int(max_rpm)
+        
+        # Derived values, computed from the decoded fields directly
+        # Wheel lock indicators (simple detection based on slip ratio)
+        wheel_lock = [
+            abs(slip) > 0.1 and abs(angular_speed) < 1.0
+            for angular_speed, slip in zip(wheel_angular_speed, wheel_slip)
+        ]
+        
+        # Speed-based gear recommendation
+        if rpm > max_rpm * 0.85:  # Above 85% of max RPM
+            gear_recommendation = 'SHIFT UP'
+        elif rpm < max_rpm * 0.3:  # Below 30% of max RPM
+            gear_recommendation = 'SHIFT DOWN'
+        else:
+            gear_recommendation = 'OPTIMAL'
+        
+        # Build result dictionary
+        result = {
+            'speed_kmh': speed_kmh,
+            'speed_mph': speed_mph,
+            'rpm': rpm,
+            'max_rpm': max_rpm,
+            'gear': gear,
+            'g_force_lateral': g_force_x,
+            'g_force_longitudinal': g_force_y,
+            'g_force_vertical': g_force_z,
+            'lap_time': lap_time,
+            'last_lap': last_lap,
+            'best_lap': best_lap,
+            'lap_count': lap_count,
+            'fuel': fuel,
+            'car_velocity': [velocity_x, velocity_y, velocity_z],
+            'car_acceleration': [accel_x, accel_y, accel_z],
+            'wheel_angular_speed': wheel_angular_speed,
+            'wheel_slip': wheel_slip,
+            'wheel_load': wheel_load,
+            'tire_pressure': tire_pressure,
+            'tire_temperature_core': tire_temp_core,
+            'suspension_travel': suspension_travel,
+            'packet_type': 'update',
+            'wheel_lock': wheel_lock,
+            'abs_in_action': any(wheel_lock),  # simplified ABS activity
+            # Delta from optimal pressure, and pressure in the tenths of a PSI the dashboard shows
+            'tire_pressure_delta': [pressure - _OPTIMAL_PRESSURE_BAR for pressure in tire_pressure],
+            'tire_pressure_psi_tenths': tuple(round(pressure * BAR_TO_PSI * 10) if math.isfinite(pressure)
+                                              else PSI_TENTHS_INVALID for pressure in tire_pressure),
+            'gear_recommendation': gear_recommendation,
+            'g_force_total': math.hypot(g_force_x, g_force_y)
+        }
+        
+        self.packet_count += 1
+        return result
     
     def _parse_spot(self, data: bytes) -> Dict[str, Any]:
         """Parse spot/position packet"""
@@ -331,56 +341,9 @@ class TelemetryParser:
         except Exception:
             return {}
     
-    def _calculate_derived_values(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate derived telemetry values"""
-        derived = {}
-        
-        try:
-            # Calculate wheel lock indicators
-            wheel_lock = []
-            for i in range(4):
-                angular_speed = data.get('wheel_angular_speed', [0]*4)[i]
-                slip = data.get('wheel_slip', [0]*4)[i]
-                # Simple wheel lock detection based on slip ratio
-                wheel_lock.append(abs(slip) > 0.1 and abs(angular_speed) < 1.0)
-            
-            derived['wheel_lock'] = wheel_lock
-            
-            # Calculate ABS activity (simplified)
-            derived['abs_in_action'] = any(wheel_lock)
-            
-            # Calculate tire pressure delta from optimal (27.5 PSI average)
-            optimal_pressure = 1.896  # 27.5 PSI in bar
-            tire_pressure_delta = []
-            for pressure in data.get('tire_pressure', [0]*4):
-                tire_pressure_delta.append(pressure - optimal_pressure)
-            
-            derived['tire_pressure_delta'] = tire_pressure_delta
-            
-            # Calculate speed-based gear recommendation
-            rpm = data.get('rpm', 0)
-            max_rpm = data.get('max_rpm', 8000)
-            
-            if rpm > max_rpm * 0.85:  # Above 85% of max RPM
-                derived['gear_recommendation'] = 'SHIFT UP'
-            elif rpm < max_rpm * 0.3:  # Below 30% of max RPM
-                derived['gear_recommendation'] = 'SHIFT DOWN'
-            else:
-                derived['gear_recommendation'] = 'OPTIMAL'
-            
-            # Calculate total G-force
-            g_lat = data.get('g_force_lateral', 0)
-            g_lon = data.get('g_force_longitudinal', 0)
-            derived['g_force_total'] = (g_lat**2 + g_lon**2)**0.5
-            
-        except Exception as e:
-            print(f"Derived calculation error: {e}")
-        
-        return derived
-    
     def get_tire_pressure_psi(self, pressure_bar: float) -> float:
         """Convert tire pressure from bar to PSI"""
-        return pressure_bar * 14.5038
+        return pressure_bar * BAR_TO_PSI
     
     def get_temperature_fahrenheit(self, temp_celsius: float) -> float:
         """Convert temperature from Celsius to Fahrenheit"""
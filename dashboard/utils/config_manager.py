@@ -2,11 +2,150 @@
 Configuration Manager for AC Telemetry Dashboard
 """
 
+import copy
 import json
 import os
-from typing import Dict, Any, Optional
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON codec on bytes: orjson when installed, otherwise the stdlib with matching output
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _loads = json.loads
+
+# Default configuration; read-only, hand out copies via ConfigManager.default_config
+_DEFAULT_CONFIG = {
+    "udp": {
+        "host": "localhost",
+        "port": 9996,
+        "timeout": 1.0,
+        "buffer_size": 4096
+    },
+    "controls": {
+        "host": "localhost",
+        "port": 9997,
+        "enabled": True
+    },
+    "window": {
+        "geometry": "1200x800",
+        "fullscreen": False,
+        "always_on_top": False,
+        "theme": "dark"
+    },
+    "display": {
+        "update_rate": 20,  # Hz
+        "units": {
+            "speed": "kmh",  # kmh or mph
+            "temperature": "celsius",  # celsius or fahrenheit
+            "pressure": "bar"  # bar or psi
+        },
+        "precision": {
+            "speed": 0,
+            "temperature": 0,
+            "pressure": 1,
+            "time": 3
+        }
+    },
+    "widgets": {
+        "enabled": {
+            "speed": True,
+            "rpm": True,
+            "gear": True,
+            "lap_time": True,
+            "tires": True,
+            "gforce": True,
+            "fuel": True,
+            "temperature": True,
+            "connection": True
+        },
+        "positions": {},  # Widget positions for custom layout
+        "sizes": {}  # Widget sizes for custom layout
+    },
+    "logging": {
+        "enabled": False,
+        "directory": "logs",
+        "format": "csv",  # csv or motec
+        "max_file_size": 100,  # MB
+        "max_files": 10,
+        "flush_every": 100  # Rows written between flushes
+    },
+    "alerts": {
+        "low_fuel_threshold": 5.0,  # Liters
+        "high_temperature_threshold": 105.0,  # Celsius
+        "tire_pressure_min": 24.0,  # PSI
+        "tire_pressure_max": 32.0,  # PSI
+        "sound_enabled": True
+    },
+    "advanced": {
+        "csp_support": True,
+        "extended_telemetry": True,
+        "debug_mode": False,
+        "performance_mode": False
+    }
+}
+
+_VALID_SPEED_UNITS = ["kmh", "mph"]
+_VALID_TEMP_UNITS = ["celsius", "fahrenheit"]
+
+# validate_config rules, built once: (section path, key, value if missing, check, error message)
+_VALIDATION_RULES = (
+    (("udp",), "port", 9996,
+     lambda port: isinstance(port, int) and 1024 <= port <= 65535,
+     "UDP port must be an integer between 1024 and 65535"),
+    (("display",), "update_rate", 20,
+     lambda rate: isinstance(rate, int) and 1 <= rate <= 60,
+     "Update rate must be an integer between 1 and 60"),
+    (("display", "units"), "speed", "kmh",
+     lambda unit: unit in _VALID_SPEED_UNITS,
+     f"Speed unit must be one of: {_VALID_SPEED_UNITS}"),
+    (("display", "units"), "temperature", "celsius",
+     lambda unit: unit in _VALID_TEMP_UNITS,
+     f"Temperature unit must be one of: {_VALID_TEMP_UNITS}"),
+    (("logging",), "max_file_size", 100,
+     lambda size: isinstance(size, (int, float)) and size > 0,
+     "Max file size must be a positive number"),
+)
+
+@lru_cache(maxsize=256)
+def _split_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dot-notation key path once; callers reuse the same few paths"""
+    return tuple(key_path.split('.'))
+
+@lru_cache(maxsize=256)
+def _path_getter(key_path: str) -> Callable[[Dict[str, Any]], Any]:
+    """Build a lookup function for a dot-notation path, specialised for the usual depths"""
+    keys = _split_path(key_path)
+    if len(keys) == 1:
+        return itemgetter(keys[0])
+    if len(keys) == 2:
+        first, second = keys
+        return lambda config: config[first][second]
+    if len(keys) == 3:
+        first, second, third = keys
+        return lambda config: config[first][second][third]
+    
+    def lookup(config: Dict[str, Any]) -> Any:
+        value = config
+        for key in keys:
+            value = value[key]
+        return value
+    return lookup
+
 class ConfigManager:
     """Manages dashboard configuration settings"""
     
@@ -33,99 +172,91 @@ class ConfigManager:
         self.controls_config_file = self.config_dir / "controls.json"
         self.layout_config_file = self.config_dir / "layout.json"
         
-        # Default configuration
-        self.default_config = {
-            "udp": {
-                "host": "localhost",
-                "port": 9996,
-                "timeout": 1.0,
-                "buffer_size": 4096
-            },
-            "controls": {
-                "host": "localhost",
-                "port": 9997,
-                "enabled": True
-            },
-            "window": {
-                "geometry": "1200x800",
-                "fullscreen": False,
-                "always_on_top": False,
-                "theme": "dark"
-            },
-            "display": {
-                "update_rate": 20,  # Hz
-                "units": {
-                    "speed": "kmh",  # kmh or mph
-                    "temperature": "celsius",  # celsius or fahrenheit
-                    "pressure": "bar"  # bar or psi
-                },
-                "precision": {
-                    "speed": 0,
-                    "temperature": 0,
-                    "pressure": 1,
-                    "time": 3
-                }
-            },
-            "widgets": {
-                "enabled": {
-                    "speed": True,
-                    "rpm": True,
-                    "gear": True,
-                    "lap_time": True,
-                    "tires": True,
-                    "gforce": True,
-                    "fuel": True,
-                    "temperature": True,
-                    "connection": True
-                },
-                "positions": {},  # Widget positions for custom layout
-                "sizes": {}  # Widget sizes for custom layout
-            },
-            "logging": {
-                "enabled": False,
-                "directory": "logs",
-                "format": "csv",  # csv or motec
-                "max_file_size": 100,  # MB
-                "max_files": 10
-            },
-            "alerts": {
-                "low_fuel_threshold": 5.0,  # Liters
-                "high_temperature_threshold": 105.0,  # Celsius
-                "tire_pressure_min": 24.0,  # PSI
-                "tire_pressure_max": 32.0,  # PSI
-                "sound_enabled": True
-            },
-            "advanced": {
-                "csp_support": True,
-                "extended_telemetry": True,
-                "debug_mode": False,
-                "performance_mode": False
-            }
-        }
+        # path -> ((st_mtime_ns, st_size), loaded config) from the last read;
+        # reused while the file on disk is unchanged
+        self._cache = {}
+        # path -> (bytes, (st_mtime_ns, st_size)) of our last write, so saving
+        # identical content over an untouched file can be skipped
+        self._last_written = {}
+    
+    @property
+    def default_config(self) -> Dict[str, Any]:
+        """A fresh deep copy of the default configuration"""
+        return copy.deepcopy(_DEFAULT_CONFIG)
+    
+    def _load_cached(self, path: Path, transform: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Read a JSON file, reusing the previous result while its mtime and size are unchanged.
+        
+        Callers get a deep copy, so they may modify the result freely.
+        Raises FileNotFoundError if the file does not exist.
+        """
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(path)
+        if cached is None or cached[0] != key:
+            # Both codecs take UTF-8 bytes directly, so skip the text decoding layer
+            with open(path, 'rb') as f:
+                data = _loads(f.read())
+            if transform is not None:
+                data = transform(data)
+            cached = (key, data)
+            self._cache[path] = cached
+        return copy.deepcopy(cached[1])
+    
+    def _write_cached(self, path: Path, config: Any, transform: Optional[Callable[[Any], Any]] = None) -> None:
+        """Atomically write config as JSON, skipping the write if the file already holds it.
+        
+        The file is written to a temporary sibling and moved into place, so a crash
+        never leaves a truncated config behind. The read cache is primed with the
+        written content so the next load does not go back to disk.
+        """
+        data = _dumps(config)
+        previous = self._last_written.get(path)
+        if previous is not None and previous[0] == data:
+            try:
+                stat = path.stat()
+                if (stat.st_mtime_ns, stat.st_size) == previous[1]:
+                    return
+            except FileNotFoundError:
+                pass
+        
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        self._last_written[path] = (data, key)
+        # Decode our own bytes so the cached copy shares nothing with the caller's dict
+        loaded = _loads(data)
+        if transform is not None:
+            loaded = transform(loaded)
+        self._cache[path] = (key, loaded)
+    
+    def _with_defaults(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a stored main config over the defaults so all keys exist"""
+        return self._merge_configs(_DEFAULT_CONFIG, config)
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
         try:
-            if self.main_config_file.exists():
-                with open(self.main_config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                # Merge with defaults to ensure all keys exist
-                return self._merge_configs(self.default_config, config)
-            else:
-                # Create default config file
-                self.save_config(self.default_config)
-                return self.default_config.copy()
-                
+            # Merge with defaults to ensure all keys exist
+            return self._load_cached(self.main_config_file, self._with_defaults)
+            
+        except FileNotFoundError:
+            # Create default config file
+            self.save_config(_DEFAULT_CONFIG)
+            return self.default_config
+            
         except Exception as e:
             print(f"Error loading config: {e}")
-            return self.default_config.copy()
+            return self.default_config
     
     def save_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to file"""
         try:
-            with open(self.main_config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            self._write_cached(self.main_config_file, config, self._with_defaults)
             return True
             
         except Exception as e:
@@ -135,34 +266,33 @@ class ConfigManager:
     def load_controls_config(self) -> Dict[str, Any]:
         """Load control key bindings configuration"""
         try:
-            if self.controls_config_file.exists():
-                with open(self.controls_config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                # Default key bindings
-                default_controls = {
-                    "keyboard": {
-                        "F1": {"command": "tc_level", "action": "toggle"},
-                        "F2": {"command": "abs_level", "action": "toggle"},
-                        "F3": {"command": "brake_bias", "action": "adjust"},
-                        "F4": {"command": "turbo_pressure", "action": "adjust"},
-                        "F5": {"command": "headlights", "action": "toggle"},
-                        "F6": {"command": "left_indicator", "action": "toggle"},
-                        "F7": {"command": "right_indicator", "action": "toggle"},
-                        "F8": {"command": "hazard_lights", "action": "toggle"},
-                        "F9": {"command": "wipers", "action": "toggle"},
-                        "F10": {"command": "pit_limiter", "action": "toggle"},
-                        "F11": {"command": "open_pit_menu", "action": "trigger"},
-                        "F12": {"command": "ignition", "action": "toggle"}
-                    },
-                    "mouse": {
-                        "enabled": True,
-                        "click_actions": True
-                    }
+            return self._load_cached(self.controls_config_file)
+            
+        except FileNotFoundError:
+            # Default key bindings
+            default_controls = {
+                "keyboard": {
+                    "F1": {"command": "tc_level", "action": "toggle"},
+                    "F2": {"command": "abs_level", "action": "toggle"},
+                    "F3": {"command": "brake_bias", "action": "adjust"},
+                    "F4": {"command": "turbo_pressure", "action": "adjust"},
+                    "F5": {"command": "headlights", "action": "toggle"},
+                    "F6": {"command": "left_indicator", "action": "toggle"},
+                    "F7": {"command": "right_indicator", "action": "toggle"},
+                    "F8": {"command": "hazard_lights", "action": "toggle"},
+                    "F9": {"command": "wipers", "action": "toggle"},
+                    "F10": {"command": "pit_limiter", "action": "toggle"},
+                    "F11": {"command": "open_pit_menu", "action": "trigger"},
+                    "F12": {"command": "ignition", "action": "toggle"}
+                },
+                "mouse": {
+                    "enabled": True,
+                    "click_actions": True
                 }
-                self.save_controls_config(default_controls)
-                return default_controls
-                
+            }
+            self.save_controls_config(default_controls)
+            return default_controls
+            
         except Exception as e:
             print(f"Error loading controls config: {e}")
             return {}
@@ -170,8 +300,7 @@ class ConfigManager:
     def save_controls_config(self, config: Dict[str, Any]) -> bool:
         """Save control configuration"""
         try:
-            with open(self.controls_config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            self._write_cached(self.controls_config_file, config)
             return True
             
         except Exception as e:
@@ -181,12 +310,11 @@ class ConfigManager:
     def load_layout_config(self) -> Dict[str, Any]:
         """Load widget layout configuration"""
         try:
-            if self.layout_config_file.exists():
-                with open(self.layout_config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return {"layouts": {}, "current_layout": "default"}
-                
+            return self._load_cached(self.layout_config_file)
+            
+        except FileNotFoundError:
+            return {"layouts": {}, "current_layout": "default"}
+            
         except Exception as e:
             print(f"Error loading layout config: {e}")
             return {"layouts": {}, "current_layout": "default"}
@@ -194,8 +322,7 @@ class ConfigManager:
     def save_layout_config(self, config: Dict[str, Any]) -> bool:
         """Save widget layout configuration"""
         try:
-            with open(self.layout_config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            self._write_cached(self.layout_config_file, config)
             return True
             
         except Exception as e:
@@ -203,32 +330,32 @@ class ConfigManager:
             return False
     
     def _merge_configs(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively merge user config with default config"""
-        result = default.copy()
+        """Deep-merge user config over default config; nested dicts merge, other values replace"""
+        result = copy.deepcopy(default)
         
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        # Walk matching subtrees with an explicit stack, updating result in place
+        stack = [(result, user)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         
         return result
     
     def get(self, key_path: str, config: Dict[str, Any], default: Any = None) -> Any:
         """Get configuration value using dot notation (e.g., 'udp.port')"""
-        keys = key_path.split('.')
-        value = config
-        
         try:
-            for key in keys:
-                value = value[key]
-            return value
+            return _path_getter(key_path)(config)
         except (KeyError, TypeError):
             return default
     
     def set(self, key_path: str, config: Dict[str, Any], value: Any) -> bool:
         """Set configuration value using dot notation"""
-        keys = key_path.split('.')
+        keys = _split_path(key_path)
         target = config
         
         try:
@@ -257,8 +384,8 @@ class ConfigManager:
                 "export_timestamp": self._get_timestamp()
             }
             
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(export_path, 'wb') as f:
+                f.write(_dumps(export_data))
             
             return True
             
@@ -269,8 +396,8 @@ class ConfigManager:
     def import_config(self, import_path: str) -> bool:
         """Import configuration from exported file"""
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            with open(import_path, 'rb') as f:
+                import_data = _loads(f.read())
             
             # Validate import data
             if "main" not in import_data:
@@ -298,11 +425,13 @@ class ConfigManager:
         try:
             # Remove existing config files
             for config_file in [self.main_config_file, self.controls_config_file, self.layout_config_file]:
-                if config_file.exists():
+                try:
                     config_file.unlink()
+                except FileNotFoundError:
+                    pass
             
             # Create default configs
-            self.save_config(self.default_config)
+            self.save_config(_DEFAULT_CONFIG)
             return True
             
         except Exception as e:
@@ -314,33 +443,12 @@ class ConfigManager:
         errors = []
         
         try:
-            # Validate UDP settings
-            udp_config = config.get("udp", {})
-            port = udp_config.get("port", 9996)
-            if not isinstance(port, int) or port < 1024 or port > 65535:
-                errors.append("UDP port must be an integer between 1024 and 65535")
-            
-            # Validate display settings
-            display_config = config.get("display", {})
-            update_rate = display_config.get("update_rate", 20)
-            if not isinstance(update_rate, int) or update_rate < 1 or update_rate > 60:
-                errors.append("Update rate must be an integer between 1 and 60")
-            
-            # Validate units
-            units = display_config.get("units", {})
-            valid_speed_units = ["kmh", "mph"]
-            if units.get("speed", "kmh") not in valid_speed_units:
-                errors.append(f"Speed unit must be one of: {valid_speed_units}")
-            
-            valid_temp_units = ["celsius", "fahrenheit"]
-            if units.get("temperature", "celsius") not in valid_temp_units:
-                errors.append(f"Temperature unit must be one of: {valid_temp_units}")
-            
-            # Validate logging settings
-            logging_config = config.get("logging", {})
-            max_file_size = logging_config.get("max_file_size", 100)
-            if not isinstance(max_file_size, (int, float)) or max_file_size <= 0:
-                errors.append("Max file size must be a positive number")
+            for section_path, key, default, check, message in _VALIDATION_RULES:
+                section = config
+                for section_key in section_path:
+                    section = section.get(section_key, {})
+                if not check(section.get(key, default)):
+                    errors.append(message)
             
         except Exception as e:
             errors.append(f"Configuration validation error: {e}")
@@ -349,26 +457,22 @@ class ConfigManager:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp string"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
+    @staticmethod
+    def _file_info(path: Path) -> Dict[str, Any]:
+        """Path, existence and size of a config file from a single stat call"""
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return {"path": str(path), "exists": False, "size": 0}
+        return {"path": str(path), "exists": True, "size": size}
+    
     def get_config_info(self) -> Dict[str, Any]:
         """Get information about configuration files"""
         return {
             "config_directory": str(self.config_dir),
-            "main_config": {
-                "path": str(self.main_config_file),
-                "exists": self.main_config_file.exists(),
-                "size": self.main_config_file.stat().st_size if self.main_config_file.exists() else 0
-            },
-            "controls_config": {
-                "path": str(self.controls_config_file),
-                "exists": self.controls_config_file.exists(),
-                "size": self.controls_config_file.stat().st_size if self.controls_config_file.exists() else 0
-            },
-            "layout_config": {
-                "path": str(self.layout_config_file),
-                "exists": self.layout_config_file.exists(),
-                "size": self.layout_config_file.stat().st_size if self.layout_config_file.exists() else 0
-            }
-        }
\ No newline at end of file
+            "main_config": self._file_info(self.main_config_file),
+            "controls_config": self._file_info(self.controls_config_file),
+            "layout_config": self._file_info(self.layout_config_file)
+        }
@@ -2,18 +2,47 @@
 Logging utility for AC Telemetry Dashboard
 """
 
+import csv
+import json
 import logging
+import logging.handlers
 import os
 import sys
+import time
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
+# No format here prints process details; skip collecting them for every record
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Write buffer for telemetry CSV files
+CSV_BUFFER_BYTES = 1 << 20
+
+# Logger instances by name, so repeated Logger(name) calls share one setup
+_logger_registry = {}
+
 class Logger:
     """Custom logger for the dashboard application"""
     
-    def __init__(self, name: str, log_dir: Optional[str] = None, level: int = logging.INFO):
+    def __new__(cls, name: str, *args, **kwargs):
+        instance = _logger_registry.get(name)
+        if instance is None:
+            instance = super().__new__(cls)
+            _logger_registry[name] = instance
+        return instance
+    
+    def __init__(self, name: str, log_dir: Optional[str] = None, level: int = logging.INFO,
+                 max_file_size: float = 10, max_files: int = 5):
+        # Instances from the registry are already set up
+        if 'logger' in self.__dict__:
+            return
+        
         self.name = name
+        self.max_bytes = int(max_file_size * 1024 * 1024)  # max_file_size is in MB
+        self.backup_count = max_files
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
         
@@ -36,10 +65,12 @@ class Logger:
             datefmt='%H:%M:%S'
         )
         
-        self.file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        # Call-site details are only worth formatting when debugging
+        if level <= logging.DEBUG:
+            file_format = '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+        else:
+            file_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        self.file_formatter = logging.Formatter(file_format, datefmt='%Y-%m-%d %H:%M:%S')
         
         # Setup handlers
         self.setup_console_handler()
@@ -58,7 +89,10 @@ class Logger:
         timestamp = datetime.now().strftime('%Y%m%d')
         log_file = self.log_dir / f"{self.name}_{timestamp}.log"
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        # Roll over by size so a long session cannot grow one file without bound
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding='utf-8'
+        )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(self.file_formatter)
         self.logger.addHandler(file_handler)
@@ -87,6 +121,28 @@ class Logger:
         """Log exception with traceback"""
         self.logger.exception(message)
 
+# CSV column sources in header order, with the value logged when a key is missing
+_SCALAR_DEFAULTS = (
+    ('speed_kmh', 0), ('speed_mph', 0), ('rpm', 0), ('max_rpm', 0), ('gear', 0),
+    ('g_force_lateral', 0), ('g_force_longitudinal', 0), ('g_force_vertical', 0),
+    ('lap_time', 0), ('last_lap', 0), ('best_lap', 0), ('lap_count', 0), ('fuel', 0)
+)
+_WHEEL_DEFAULTS = (
+    ('tire_pressure', (0, 0, 0, 0)),
+    ('tire_temperature_core', (0, 0, 0, 0)),
+    ('tire_wear', (100, 100, 100, 100)),
+    ('wheel_load', (0, 0, 0, 0)),
+    ('suspension_travel', (0, 0, 0, 0))
+)
+_SETTINGS_DEFAULTS = (
+    ('brake_bias', 0.5), ('tc_setting', 0), ('abs_setting', 0), ('pit_limiter_on', False),
+    ('water_temp', 0), ('oil_temp', 0), ('turbo_pressure', 0)
+)
+_ROW_DEFAULTS = dict(_SCALAR_DEFAULTS + _WHEEL_DEFAULTS + _SETTINGS_DEFAULTS)
+_SCALAR_GET = itemgetter(*(key for key, _ in _SCALAR_DEFAULTS))
+_WHEEL_GET = itemgetter(*(key for key, _ in _WHEEL_DEFAULTS))
+_SETTINGS_GET = itemgetter(*(key for key, _ in _SETTINGS_DEFAULTS))
+
 class TelemetryLogger:
     """Logger specifically for telemetry data"""
     
@@ -102,6 +158,17 @@ class TelemetryLogger:
         self.csv_file = None
         self.csv_writer = None
         self.session_start_time = None
+        # Session start on the perf_counter and wall clocks; row timestamps
+        # are derived from these instead of reading the wall clock per row
+        self._start_perf = 0.0
+        self._start_wall = 0.0
+        
+        # Rows are collected here and handed to the CSV writer in batches
+        self._row_buf = []
+        self._flush_every = 200
+        # Buffered rows reach the OS at most this often (seconds)
+        self._flush_interval = 1.0
+        self._last_flush = 0.0
     
     def start_session(self, car_name: str = "unknown", track_name: str = "unknown"):
         """Start a new telemetry logging session"""
@@ -117,10 +184,10 @@ class TelemetryLogger:
             csv_filename = f"{session_name}.csv"
             csv_path = self.log_dir / csv_filename
             
-            self.csv_file = open(csv_path, 'w', newline='', encoding='utf-8')
+            # Large buffer: batches accumulate in memory between timed flushes
+            self.csv_file = open(csv_path, 'w', buffering=CSV_BUFFER_BYTES, newline='', encoding='utf-8')
             
             # Write CSV header
-            import csv
             self.csv_writer = csv.writer(self.csv_file)
             
             # CSV header with all telemetry fields
@@ -141,7 +208,9 @@ class TelemetryLogger:
             self.csv_file.flush()
             
             self.current_session = session_name
-            self.session_start_time = datetime.now()
+            self._start_perf = time.perf_counter()
+            self._start_wall = time.time()
+            self.session_start_time = datetime.fromtimestamp(self._start_wall)
             
             print(f"Started telemetry logging session: {session_name}")
             return True
@@ -156,57 +225,27 @@ class TelemetryLogger:
             if not self.csv_writer or not self.session_start_time:
                 return False
             
-            # Calculate session time
-            session_time = (datetime.now() - self.session_start_time).total_seconds()
-            
-            # Extract data with defaults
-            row = [
-                datetime.now().isoformat(),
-                session_time,
-                data.get('speed_kmh', 0),
-                data.get('speed_mph', 0),
-                data.get('rpm', 0),
-                data.get('max_rpm', 0),
-                data.get('gear', 0),
-                data.get('g_force_lateral', 0),
-                data.get('g_force_longitudinal', 0),
-                data.get('g_force_vertical', 0),
-                data.get('lap_time', 0),
-                data.get('last_lap', 0),
-                data.get('best_lap', 0),
-                data.get('lap_count', 0),
-                data.get('fuel', 0)
-            ]
-            
-            # Tire data
-            tire_pressure = data.get('tire_pressure', [0, 0, 0, 0])
-            tire_temp = data.get('tire_temperature_core', [0, 0, 0, 0])
-            tire_wear = data.get('tire_wear', [100, 100, 100, 100])
-            wheel_load = data.get('wheel_load', [0, 0, 0, 0])
-            suspension_travel = data.get('suspension_travel', [0, 0, 0, 0])
+            # Calculate session time; one clock read covers both columns
+            session_time = time.perf_counter() - self._start_perf
             
-            row.extend(tire_pressure)
-            row.extend(tire_temp)
-            row.extend(tire_wear)
-            row.extend(wheel_load)
-            row.extend(suspension_travel)
+            # Fill missing keys from the defaults in one C-level update, then
+            # pull every column out with the precomputed getters
+            values = _ROW_DEFAULTS.copy()
+            values.update(data)
             
-            # Vehicle settings
-            row.extend([
-                data.get('brake_bias', 0.5),
-                data.get('tc_setting', 0),
-                data.get('abs_setting', 0),
-                data.get('pit_limiter_on', False),
-                data.get('water_temp', 0),
-                data.get('oil_temp', 0),
-                data.get('turbo_pressure', 0)
-            ])
-            
-            self.csv_writer.writerow(row)
+            pressure, temperature, wear, load, travel = _WHEEL_GET(values)
+            # Built in one expression: a single tuple allocation, no resizing
+            row = (
+                datetime.fromtimestamp(self._start_wall + session_time).isoformat(),
+                session_time,
+                *_SCALAR_GET(values),
+                *pressure, *temperature, *wear, *load, *travel,
+                *_SETTINGS_GET(values)
+            )
             
-            # Flush every 10 rows for better performance
-            if self.csv_writer.line_num % 10 == 0:
-                self.csv_file.flush()
+            self._row_buf.append(row)
+            if len(self._row_buf) >= self._flush_every:
+                self._write_rows()
             
             return True
             
@@ -214,10 +253,24 @@ class TelemetryLogger:
             print(f"Error logging telemetry data: {e}")
             return False
     
+    def _write_rows(self):
+        """Write the buffered rows in one batch; flush to disk if the flush interval has passed"""
+        self.csv_writer.writerows(self._row_buf)
+        self._row_buf.clear()
+        now = time.monotonic()
+        if now - self._last_flush >= self._flush_interval:
+            self.csv_file.flush()
+            self._last_flush = now
+    
     def end_session(self):
         """End current telemetry logging session"""
         try:
             if self.csv_file:
+                if self._row_buf:
+                    self._write_rows()
+                # Make the finished session durable before closing
+                self.csv_file.flush()
+                os.fsync(self.csv_file.fileno())
                 self.csv_file.close()
                 self.csv_file = None
                 self.csv_writer = None
@@ -236,27 +289,6 @@ class TelemetryLogger:
             # This is a simplified example - full MoTeC export would require
             # the MoTeC SDK or detailed knowledge of their file format
             
-            import csv
-            import json
-            
-            # Read CSV data
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                data = list(reader)
-            
-            # Create MoTeC-compatible JSON (simplified format)
-            motec_data = {
-                "session_info": {
-                    "vehicle": "AC_Vehicle",
-                    "track": "AC_Track",
-                    "driver": "AC_Driver",
-                    "date": datetime.now().isoformat(),
-                    "duration": len(data) / 20  # Assuming 20Hz data
-                },
-                "channels": {},
-                "data": data
-            }
-            
             # Define channel mappings
             channel_mappings = {
                 "speed_kmh": {"name": "Ground Speed", "unit": "km/h", "frequency": 20},
@@ -268,11 +300,31 @@ class TelemetryLogger:
                 "fuel": {"name": "Fuel Level", "unit": "L", "frequency": 1}
             }
             
-            motec_data["channels"] = channel_mappings
-            
-            # Save as JSON (MoTeC would use binary format)
-            with open(motec_path, 'w', encoding='utf-8') as f:
-                json.dump(motec_data, f, indent=2)
+            # Save as JSON (MoTeC would use binary format). Rows are streamed
+            # from the CSV one at a time, so session_info, which needs the row
+            # count, is written after the data array.
+            with open(csv_path, 'r', newline='', encoding='utf-8') as src, \
+                    open(motec_path, 'w', encoding='utf-8') as f:
+                f.write('{\n"channels": ')
+                json.dump(channel_mappings, f, indent=2)
+                f.write(',\n"data": [')
+                
+                row_count = 0
+                for row in csv.DictReader(src):
+                    f.write(',\n' if row_count else '\n')
+                    f.write(json.dumps(row))
+                    row_count += 1
+                
+                session_info = {
+                    "vehicle": "AC_Vehicle",
+                    "track": "AC_Track",
+                    "driver": "AC_Driver",
+                    "date": datetime.now().isoformat(),
+                    "duration": row_count / 20  # Assuming 20Hz data
+                }
+                f.write('\n],\n"session_info": ')
+                json.dump(session_info, f, indent=2)
+                f.write('\n}\n')
             
             print(f"Exported telemetry to MoTeC format: {motec_path}")
             return True
@@ -287,10 +339,14 @@ class TelemetryLogger:
             cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 3600)
             
             deleted_count = 0
-            for log_file in self.log_dir.glob("*.csv"):
-                if log_file.stat().st_mtime < cutoff_time:
-                    log_file.unlink()
-                    deleted_count += 1
+            # scandir yields names without a stat; only .csv entries are stat'ed, once each
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.csv') or not entry.is_file():
+                        continue
+                    if entry.stat().st_mtime < cutoff_time:
+                        os.unlink(entry.path)
+                        deleted_count += 1
             
             if deleted_count > 0:
                 print(f"Cleaned up {deleted_count} old telemetry log files")
@@ -303,7 +359,7 @@ class TelemetryLogger:
         if not self.current_session or not self.session_start_time:
             return {}
         
-        session_duration = (datetime.now() - self.session_start_time).total_seconds()
+        session_duration = time.perf_counter() - self._start_perf
         
         return {
             "session_name": self.current_session,
@@ -4,27 +4,98 @@ AC Telemetry Dashboard Installer
 Automated installation script for Windows and Linux
 """
 
+import argparse
 import os
 import sys
 import shutil
 import subprocess
+import importlib.util
+from importlib import metadata
 from pathlib import Path
 import platform
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:
+    Requirement = None
+
+# Environment facts that cannot change while the installer runs
+_SYSTEM = platform.system()
+_HOME = Path.home()
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _SCRIPT_DIR.parent
+
+# Upper bound on concurrent file copies during installation
+MAX_COPY_WORKERS = 8
+
+# Common Steam install locations of Assetto Corsa on Windows
+_STEAM_CANDIDATES = (
+    "C:/Program Files (x86)/Steam/steamapps/common/assettocorsa",
+    "C:/Program Files/Steam/steamapps/common/assettocorsa",
+    "D:/Steam/steamapps/common/assettocorsa",
+    "E:/Steam/steamapps/common/assettocorsa",
+)
+
+# Steam install locations on Linux, relative to the home directory
+_LINUX_HOME_CANDIDATES = (
+    ".steam/steam/steamapps/common/assettocorsa",
+    ".local/share/Steam/steamapps/common/assettocorsa",
+)
+
+def _query_steam_path() -> Optional[str]:
+    """Steam install directory from the registry, machine-wide key first, then per-user"""
+    import winreg
+    
+    registry_keys = (
+        (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam", "InstallPath"),
+        (winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam", "SteamPath"),
+    )
+    for hive, subkey, value_name in registry_keys:
+        try:
+            with winreg.OpenKey(hive, subkey) as key:
+                return winreg.QueryValueEx(key, value_name)[0]
+        except OSError:
+            continue
+    return None
+
+def _list_files(directory: Path, suffix: str) -> list:
+    """Directory entries of the regular files in directory whose names end with suffix"""
+    with os.scandir(directory) as entries:
+        return [entry for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+
+def _install_file(source, dest: str, link: bool = False):
+    """Replace dest with source, hard-linking it when asked and the filesystem allows it"""
+    # Unlink first: copying onto an earlier hard link would write through to the source
+    try:
+        os.unlink(dest)
+    except FileNotFoundError:
+        pass
+    if link:
+        try:
+            os.link(source, dest)
+            return
+        except OSError:
+            # Different volume, or a filesystem/account without hard-link support
+            pass
+    shutil.copyfile(source, dest)
+
 class DashboardInstaller:
     """Installer for AC Telemetry Dashboard"""
     
-    def __init__(self):
-        self.system = platform.system()
-        self.script_dir = Path(__file__).parent
-        self.project_root = self.script_dir.parent
+    def __init__(self, link_lua: bool = False):
+        self.system = _SYSTEM
+        self.link_lua = link_lua  # hard-link Lua scripts instead of copying them
+        self.script_dir = _SCRIPT_DIR
+        self.project_root = _PROJECT_ROOT
         
         # Installation paths
         self.ac_paths = self.detect_ac_installation()
-        self.documents_path = Path.home() / "Documents"
+        self.documents_path = _HOME / "Documents"
         self.ac_documents = self.documents_path / "Assetto Corsa"
+        self.ac_cfg_dir = self.ac_documents / "cfg"
         
         print("AC Telemetry Dashboard Installer")
         print("=" * 40)
@@ -33,44 +104,35 @@ class DashboardInstaller:
         
     def detect_ac_installation(self) -> list:
         """Detect Assetto Corsa installation paths"""
-        possible_paths = []
-        
+        # Candidates stay plain strings; only directories that exist become Paths
         if self.system == "Windows":
-            # Common Steam installation paths
-            steam_paths = [
-                Path("C:/Program Files (x86)/Steam/steamapps/common/assettocorsa"),
-                Path("C:/Program Files/Steam/steamapps/common/assettocorsa"),
-                Path("D:/Steam/steamapps/common/assettocorsa"),
-                Path("E:/Steam/steamapps/common/assettocorsa"),
-            ]
-            
-            # Check registry for Steam path
-            try:
-                import winreg
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                   r"SOFTWARE\WOW6432Node\Valve\Steam") as key:
-                    steam_path = winreg.QueryValueEx(key, "InstallPath")[0]
-                    steam_ac = Path(steam_path) / "steamapps/common/assettocorsa"
-                    if steam_ac.exists():
-                        possible_paths.append(steam_ac)
-            except (ImportError, FileNotFoundError, OSError):
-                pass
-            
-            # Add common paths
-            possible_paths.extend(steam_paths)
-            
-        else:  # Linux
-            # Common Linux Steam paths
-            linux_paths = [
-                Path.home() / ".steam/steam/steamapps/common/assettocorsa",
-                Path.home() / ".local/share/Steam/steamapps/common/assettocorsa",
-                Path("/usr/games/assettocorsa"),
-            ]
-            possible_paths.extend(linux_paths)
+            # The registry names Steam's own install; trust it and skip the drive scan
+            steam_path = _query_steam_path()
+            if steam_path:
+                steam_ac = os.path.join(steam_path, "steamapps/common/assettocorsa")
+                if os.path.isdir(steam_ac):
+                    return self.report_ac_installations([Path(steam_ac)])
         
-        # Filter existing paths
-        existing_paths = [path for path in possible_paths if path.exists()]
+        existing = (path for path in self.candidate_ac_paths() if os.path.isdir(path))
+        if sys.stdin is None or not sys.stdin.isatty():
+            # Scripted run: nobody can choose between installs, so stop at the first one
+            first = next(existing, None)
+            return self.report_ac_installations([Path(first)] if first else [])
         
+        # Filter existing paths
+        return self.report_ac_installations([Path(path) for path in existing])
+    
+    def candidate_ac_paths(self):
+        """Yield the common AC install locations for this platform, most likely first"""
+        if self.system == "Windows":
+            yield from _STEAM_CANDIDATES
+        else:  # Linux
+            for candidate in _LINUX_HOME_CANDIDATES:
+                yield os.path.join(_HOME, candidate)
+            yield "/usr/games/assettocorsa"
+    
+    def report_ac_installations(self, existing_paths: list) -> list:
+        """Print the detected AC installations and return them"""
         if existing_paths:
             print(f"Found AC installations:")
             for i, path in enumerate(existing_paths):
@@ -89,9 +151,8 @@ class DashboardInstaller:
                 if path_input.lower() == 'q':
                     return None
                 
-                ac_path = Path(path_input)
-                if ac_path.exists() and (ac_path / "acs.exe").exists():
-                    return ac_path
+                if os.path.isfile(os.path.join(path_input, "acs.exe")):
+                    return Path(path_input)
                 else:
                     print("Invalid AC installation path. Please try again.")
         
@@ -122,22 +183,30 @@ class DashboardInstaller:
     
     def install_python_dependencies(self) -> bool:
         """Install Python dependencies"""
-        print("\n" + "=" * 40)
-        print("Installing Python dependencies...")
-        
         requirements_file = self.project_root / "requirements.txt"
-        if not requirements_file.exists():
+        # Read it straight away; a missing file shows up as FileNotFoundError
+        try:
+            with open(requirements_file, 'r', encoding='utf-8') as f:
+                requirement_lines = f.read().splitlines()
+        except FileNotFoundError:
             print("Requirements file not found. Skipping dependency installation.")
             return True
         
+        if self.requirements_satisfied(requirement_lines):
+            print("Python dependencies already installed.")
+            return True
+        
+        # Check if pip is available without starting it
+        if importlib.util.find_spec("pip") is None:
+            print("pip not found. Please install Python dependencies manually:")
+            print(f"  pip install -r {requirements_file}")
+            return False
+        
         try:
-            # Check if pip is available
-            subprocess.run([sys.executable, "-m", "pip", "--version"], 
-                          check=True, capture_output=True)
-            
-            # Install dependencies
-            cmd = [sys.executable, "-m", "pip", "install", "-r", str(requirements_file)]
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            # Install dependencies; pip's progress goes straight to the console
+            cmd = [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input",
+                   "-r", str(requirements_file)]
+            subprocess.run(cmd, check=True)
             
             print("Python dependencies installed successfully!")
             return True
@@ -153,11 +222,70 @@ class DashboardInstaller:
             print(f"  pip install -r {requirements_file}")
             return False
     
+    def copy_files(self, file_pairs: list, link: bool = False) -> bool:
+        """Copy (source, destination) pairs concurrently; report failures together
+        
+        Sources may be Paths or os.DirEntry objects; both have a name.
+        With link=True, destinations are hard-linked where the filesystem allows it.
+        """
+        if not file_pairs:
+            return True
+        
+        # Fresh installs gain nothing from copied metadata; copyfile only moves the
+        # data, through the platform's fast copy call where there is one
+        with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(file_pairs))) as executor:
+            futures = [(source, executor.submit(_install_file, source, dest, link)) for source, dest in file_pairs]
+        
+        copied = []
+        failures = []
+        for source, future in futures:
+            error = future.exception()
+            if error is None:
+                copied.append(source.name)
+            else:
+                failures.append(f"{source.name} ({error})")
+        
+        if copied:
+            print(f"  {'Installed' if link else 'Copied'}: {', '.join(copied)}")
+        if failures:
+            print(f"  Failed to copy: {', '.join(failures)}")
+            return False
+        return True
+    
+    def requirements_satisfied(self, requirement_lines: list) -> bool:
+        """Check whether every requirements.txt line is already installed, without starting pip"""
+        if Requirement is None:
+            # Cannot evaluate version specifiers; let pip decide
+            return False
+        
+        for line in requirement_lines:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            
+            try:
+                requirement = Requirement(line)
+            except InvalidRequirement:
+                return False
+            
+            if requirement.marker is not None and not requirement.marker.evaluate():
+                continue
+            
+            try:
+                installed_version = metadata.version(requirement.name)
+            except metadata.PackageNotFoundError:
+                # Modules shipped with Python (tkinter) have no distribution metadata
+                if requirement.specifier or importlib.util.find_spec(requirement.name) is None:
+                    return False
+                continue
+            
+            if not requirement.specifier.contains(installed_version, prereleases=True):
+                return False
+        
+        return True
+    
     def install_lua_scripts(self, ac_path: Path) -> bool:
         """Install Lua scripts to AC"""
-        print("\n" + "=" * 40)
-        print("Installing Lua scripts...")
-        
         # Source and destination paths
         lua_source = self.project_root / "lua_scripts"
         lua_dest = ac_path / "apps" / "lua" / "dashboard_extension"
@@ -171,10 +299,11 @@ class DashboardInstaller:
             lua_dest.mkdir(parents=True, exist_ok=True)
             
             # Copy Lua files
-            for lua_file in lua_source.glob("*.lua"):
-                dest_file = lua_dest / lua_file.name
-                shutil.copy2(lua_file, dest_file)
-                print(f"  Copied: {lua_file.name}")
+            lua_dest_str = os.fspath(lua_dest)
+            lua_files = _list_files(lua_source, ".lua")
+            lua_pairs = [(lua_file, os.path.join(lua_dest_str, lua_file.name)) for lua_file in lua_files]
+            if not self.copy_files(lua_pairs, link=self.link_lua):
+                return False
             
             print(f"Lua scripts installed to: {lua_dest}")
             return True
@@ -185,11 +314,8 @@ class DashboardInstaller:
     
     def install_config_files(self) -> bool:
         """Install configuration files"""
-        print("\n" + "=" * 40)
-        print("Installing configuration files...")
-        
         # Create AC documents directory if it doesn't exist
-        ac_cfg_dir = self.ac_documents / "cfg"
+        ac_cfg_dir = self.ac_cfg_dir
         ac_cfg_dir.mkdir(parents=True, exist_ok=True)
         
         # Source configuration files
@@ -197,14 +323,18 @@ class DashboardInstaller:
         
         try:
             if config_source.exists():
-                # Copy example configuration files
-                for config_file in config_source.glob("*.json"):
-                    dest_file = ac_cfg_dir / config_file.name
-                    if not dest_file.exists():  # Don't overwrite existing configs
-                        shutil.copy2(config_file, dest_file)
-                        print(f"  Copied: {config_file.name}")
-                    else:
+                # Copy example configuration files, never overwriting existing configs
+                ac_cfg_dir_str = os.fspath(ac_cfg_dir)
+                to_copy = []
+                for config_file in _list_files(config_source, ".json"):
+                    dest_file = os.path.join(ac_cfg_dir_str, config_file.name)
+                    if os.path.exists(dest_file):
                         print(f"  Skipped (exists): {config_file.name}")
+                    else:
+                        to_copy.append((config_file, dest_file))
+                
+                if not self.copy_files(to_copy):
+                    return False
             
             print(f"Configuration files installed to: {ac_cfg_dir}")
             return True
@@ -215,15 +345,12 @@ class DashboardInstaller:
     
     def create_shortcuts(self) -> bool:
         """Create desktop shortcuts"""
-        print("\n" + "=" * 40)
-        print("Creating shortcuts...")
-        
         try:
             dashboard_script = self.project_root / "dashboard" / "main.py"
             
             if self.system == "Windows":
                 # Create Windows shortcut
-                desktop = Path.home() / "Desktop"
+                desktop = _HOME / "Desktop"
                 shortcut_path = desktop / "AC Telemetry Dashboard.lnk"
                 
                 try:
@@ -243,7 +370,7 @@ class DashboardInstaller:
                     
             else:  # Linux
                 # Create .desktop file
-                desktop = Path.home() / "Desktop"
+                desktop = _HOME / "Desktop"
                 desktop_file = desktop / "ac-telemetry-dashboard.desktop"
                 
                 desktop_content = f"""[Desktop Entry]
@@ -275,20 +402,16 @@ Path={self.project_root}
         
         checks = []
         
-        # Check Python dependencies
-        try:
-            import tkinter
-            checks.append(("Python GUI (tkinter)", True))
-        except ImportError:
-            checks.append(("Python GUI (tkinter)", False))
+        # Check Python dependencies; locate tkinter and its C extension without loading them
+        tkinter_found = all(importlib.util.find_spec(name) is not None for name in ("tkinter", "_tkinter"))
+        checks.append(("Python GUI (tkinter)", tkinter_found))
         
         # Check main dashboard script
         main_script = self.project_root / "dashboard" / "main.py"
-        checks.append(("Dashboard script", main_script.exists()))
+        checks.append(("Dashboard script", os.access(main_script, os.F_OK)))
         
         # Check configuration directory
-        cfg_dir = self.ac_documents / "cfg"
-        checks.append(("Configuration directory", cfg_dir.exists()))
+        checks.append(("Configuration directory", os.access(self.ac_cfg_dir, os.F_OK)))
         
         # Print results
         all_good = True
@@ -322,7 +445,8 @@ Path={self.project_root}
         
         success_count = 0
         for step_name, step_func in steps:
-            print(f"\n{step_name}...")
+            # Single header per step; the step functions print only their details
+            print(f"\n{'=' * 40}\n{step_name}...")
             try:
                 if step_func():
                     success_count += 1
@@ -332,8 +456,7 @@ Path={self.project_root}
             except Exception as e:
                 print(f"✗ {step_name} failed: {e}")
         
-        # Verify installation
-        print("\n" + "=" * 40)
+        # Verify installation (prints its own header)
         if self.verify_installation():
             print("\n🎉 Installation completed successfully!")
             print("\nNext steps:")
@@ -349,7 +472,13 @@ Path={self.project_root}
 
 def main():
     """Main installation function"""
-    installer = DashboardInstaller()
+    parser = argparse.ArgumentParser(description="AC Telemetry Dashboard Installer")
+    parser.add_argument("--link", action="store_true",
+                        help="hard-link the Lua scripts into AC instead of copying them "
+                             "(falls back to copying across drives)")
+    args = parser.parse_args()
+    
+    installer = DashboardInstaller(link_lua=args.link)
     
     try:
         success = installer.run_installation()